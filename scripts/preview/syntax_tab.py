@@ -5,8 +5,6 @@ This tab shows code examples with syntax highlighting using the current theme's
 syntax colors.
 """
 
-# Import yaml directly instead of using themeweaver loaders
-import yaml
 from PyQt5.QtCore import QSize
 from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
 from PyQt5.QtWidgets import (
@@ -20,6 +18,7 @@ from PyQt5.QtWidgets import (
 )
 
 from themeweaver.core.syntax_schema import formatted_editor_keys
+from themeweaver.core.yaml_loader import safe_load_yaml
 
 
 class SyntaxHighlighter(QPlainTextEdit):
@@ -89,10 +88,10 @@ class SyntaxHighlighter(QPlainTextEdit):
 
             # Load data from files
             with open(colors_path, "r") as f:
-                colors_data = yaml.safe_load(f)
+                colors_data = safe_load_yaml(f)
 
             with open(mappings_path, "r") as f:
-                mappings_yaml = yaml.safe_load(f)
+                mappings_yaml = safe_load_yaml(f)
                 mappings_data = mappings_yaml.get("color_classes", {})
                 semantic_mappings = mappings_yaml.get("semantic_mappings", {})
 
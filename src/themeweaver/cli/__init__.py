@@ -9,18 +9,7 @@ import logging
 import sys
 from importlib.metadata import PackageNotFoundError, version
 
-from themeweaver.cli.commands import (
-    cmd_export,
-    cmd_generate,
-    cmd_gradient,
-    cmd_info,
-    cmd_interpolate,
-    cmd_list,
-    cmd_palette,
-    cmd_python_package,
-    cmd_validate,
-    cmd_validate_contrast,
-)
+from themeweaver.cli import commands
 from themeweaver.cli.utils import setup_logging
 from themeweaver.core.syntax_schema import (
     syntax_format_elements,
@@ -35,6 +24,15 @@ except PackageNotFoundError:
     _CLI_VERSION = "0.0.0"
 
 
+def _command(name):
+    """Return a handler that imports and runs commands.<name> when invoked."""
+
+    def run(args):
+        return getattr(commands, name)(args)
+
+    return run
+
+
 def create_parser():
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -57,7 +55,7 @@ def create_parser():
         "--theme-dir",
         help="Source directory where themes are stored (input). If not provided, uses themes/ directory in current working directory.",
     )
-    list_parser.set_defaults(func=cmd_list)
+    list_parser.set_defaults(func=_command("cmd_list"))
 
     # Info command
     info_parser = subparsers.add_parser("info", help="Show detailed theme information")
@@ -66,7 +64,7 @@ def create_parser():
         "--theme-dir",
         help="Source directory where themes are stored (input). If not provided, uses themes/ directory in current working directory.",
     )
-    info_parser.set_defaults(func=cmd_info)
+    info_parser.set_defaults(func=_command("cmd_info"))
 
     # Export command
     export_parser = subparsers.add_parser(
@@ -89,7 +87,7 @@ def create_parser():
         "-o",
         help="Output directory where exported themes will be saved (destination). Default: build/ (at workspace root)",
     )
-    export_parser.set_defaults(func=cmd_export)
+    export_parser.set_defaults(func=_command("cmd_export"))
 
     # Validate command
     validate_parser = subparsers.add_parser(
@@ -100,7 +98,7 @@ def create_parser():
         "--theme-dir",
         help="Source directory where themes are stored (input). If not provided, uses themes/ directory in current working directory.",
     )
-    validate_parser.set_defaults(func=cmd_validate)
+    validate_parser.set_defaults(func=_command("cmd_validate"))
 
     # Validate contrast command
     contrast_parser = subparsers.add_parser(
@@ -134,7 +132,7 @@ def create_parser():
         action="store_true",
         help="Show all rules including passed ones",
     )
-    contrast_parser.set_defaults(func=cmd_validate_contrast)
+    contrast_parser.set_defaults(func=_command("cmd_validate_contrast"))
 
     syntax_palette_size = syntax_palette_slot_count()
     syntax_elements = ", ".join(syntax_format_elements())
@@ -235,7 +233,7 @@ def create_parser():
         help="Output directory where the generated theme will be saved (destination). Default: themes/ directory in current working directory",
     )
 
-    generate_parser.set_defaults(func=cmd_generate)
+    generate_parser.set_defaults(func=_command("cmd_generate"))
 
     # Interpolate command
     interpolate_parser = subparsers.add_parser(
@@ -292,7 +290,7 @@ def create_parser():
     interpolate_parser.add_argument(
         "--validate", action="store_true", help="Validate gradient uniqueness"
     )
-    interpolate_parser.set_defaults(func=cmd_interpolate)
+    interpolate_parser.set_defaults(func=_command("cmd_interpolate"))
 
     # Gradient command
     gradient_parser = subparsers.add_parser(
@@ -339,7 +337,7 @@ def create_parser():
     gradient_parser.add_argument(
         "--validate", action="store_true", help="Validate gradient uniqueness"
     )
-    gradient_parser.set_defaults(func=cmd_gradient)
+    gradient_parser.set_defaults(func=_command("cmd_gradient"))
 
     # Palette command
     palette_parser = subparsers.add_parser("palette", help="Generate color palettes")
@@ -376,7 +374,7 @@ def create_parser():
         action="store_true",
         help="Skip chromatic distance analysis output",
     )
-    palette_parser.set_defaults(func=cmd_palette)
+    palette_parser.set_defaults(func=_command("cmd_palette"))
 
     # Package as Spyder-compatible package
     parser_python_package = subparsers.add_parser(
@@ -416,7 +414,7 @@ def create_parser():
         metavar="DIR",
         help="Pass --outdir to build (default: <package_dir>/dist)",
     )
-    parser_python_package.set_defaults(func=cmd_python_package)
+    parser_python_package.set_defaults(func=_command("cmd_python_package"))
 
     return parser
 
@@ -2,14 +2,22 @@
 CLI command implementations.
 """
 
-from themeweaver.cli.commands.color_generation import cmd_palette
-from themeweaver.cli.commands.color_gradient import cmd_gradient
-from themeweaver.cli.commands.color_interpolation import cmd_interpolate
-from themeweaver.cli.commands.contrast_validation import cmd_validate_contrast
-from themeweaver.cli.commands.theme_export import cmd_export
-from themeweaver.cli.commands.theme_generation import cmd_generate
-from themeweaver.cli.commands.theme_management import cmd_info, cmd_list, cmd_validate
-from themeweaver.cli.commands.theme_package import cmd_python_package
+import importlib
+
+# Module implementing each command. They are imported on first access, so
+# building the parser (and --help) doesn't load numpy and colorspacious.
+_COMMAND_MODULES = {
+    "cmd_palette": "color_generation",
+    "cmd_gradient": "color_gradient",
+    "cmd_interpolate": "color_interpolation",
+    "cmd_validate_contrast": "contrast_validation",
+    "cmd_export": "theme_export",
+    "cmd_generate": "theme_generation",
+    "cmd_info": "theme_management",
+    "cmd_list": "theme_management",
+    "cmd_validate": "theme_management",
+    "cmd_python_package": "theme_package",
+}
 
 __all__ = [
     "cmd_list",
@@ -23,3 +31,10 @@ __all__ = [
     "cmd_palette",
     "cmd_python_package",
 ]
+
+
+def __getattr__(name):
+    module = _COMMAND_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
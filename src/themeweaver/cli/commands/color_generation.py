@@ -4,7 +4,8 @@ Color generation command.
 
 import json
 import logging
-from typing import Any, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from themeweaver.cli.error_handling import operation_context
 from themeweaver.color_utils.color_analysis import analyze_chromatic_distances
@@ -80,77 +81,69 @@ def _log_palette_header(args: Any, method_info: str) -> None:
     _logger.info("📊 Colors: %d", args.num_colors)
 
 
+@lru_cache(maxsize=None)
+def _step_labels(count: int) -> Tuple[str, ...]:
+    """B-step labels (B10, B20, ...) for a palette of ``count`` colors."""
+    return tuple(f"B{(i + 1) * 10}" for i in range(count))
+
+
+def _labeled(colors: List[str]) -> Dict[str, str]:
+    """Map each color to its B-step label, in palette order."""
+    return dict(zip(_step_labels(len(colors)), colors))
+
+
+def _class_block(name: str, description: str, colors: List[str]) -> List[str]:
+    """Lines of a Python color class with one B-step attribute per color."""
+    lines = [f"class {name}:", '    """', f"    {description}", '    """', ""]
+    lines.extend(f"    {step} = '{color}'" for step, color in _labeled(colors).items())
+    return lines
+
+
+def _list_block(title: str, colors: List[str]) -> List[str]:
+    """Lines of a titled "B-step: color" listing."""
+    lines = [title]
+    lines.extend(f"  {step}: {color}" for step, color in _labeled(colors).items())
+    return lines
+
+
 def _emit_palette_output(
     args: Any, dark_colors: List[str], light_colors: List[str]
 ) -> None:
+    # Each format is assembled first and written with a single print()
     if args.output_format == "class":
         if args.method == "syntax":
-            print("class Syntax:")
-            print('    """')
-            print("    Syntax highlighting colors.")
-            print('    """')
-            print()
-
-            for i, color in enumerate(dark_colors):
-                step = (i + 1) * 10
-                print(f"    B{step} = '{color}'")
+            lines = _class_block("Syntax", "Syntax highlighting colors.", dark_colors)
         else:
-            print("class GroupDark:")
-            print('    """')
-            print("    Group Colors for the dark palette.")
-            print('    """')
-            print()
-
-            for i, color in enumerate(dark_colors):
-                step = (i + 1) * 10
-                print(f"    B{step} = '{color}'")
-
-            print("\n")
-
-            print("class GroupLight:")
-            print('    """')
-            print("    Group Colors for the light palette.")
-            print('    """')
-            print()
-
-            for i, color in enumerate(light_colors):
-                step = (i + 1) * 10
-                print(f"    B{step} = '{color}'")
+            lines = [
+                *_class_block(
+                    "GroupDark", "Group Colors for the dark palette.", dark_colors
+                ),
+                "\n",
+                *_class_block(
+                    "GroupLight", "Group Colors for the light palette.", light_colors
+                ),
+            ]
+        print("\n".join(lines))
 
     elif args.output_format == "json":
         if args.method == "syntax":
-            result = {
-                "Syntax": {
-                    f"B{(i + 1) * 10}": color for i, color in enumerate(dark_colors)
-                }
-            }
+            result = {"Syntax": _labeled(dark_colors)}
         else:
             result = {
-                "GroupDark": {
-                    f"B{(i + 1) * 10}": color for i, color in enumerate(dark_colors)
-                },
-                "GroupLight": {
-                    f"B{(i + 1) * 10}": color for i, color in enumerate(light_colors)
-                },
+                "GroupDark": _labeled(dark_colors),
+                "GroupLight": _labeled(light_colors),
             }
         print(json.dumps(result, indent=2))
 
     elif args.output_format == "list":
         if args.method == "syntax":
-            print("Syntax colors:")
-            for i, color in enumerate(dark_colors):
-                step = (i + 1) * 10
-                print(f"  B{step}: {color}")
+            lines = _list_block("Syntax colors:", dark_colors)
         else:
-            print("GroupDark colors:")
-            for i, color in enumerate(dark_colors):
-                step = (i + 1) * 10
-                print(f"  B{step}: {color}")
-
-            print("\nGroupLight colors:")
-            for i, color in enumerate(light_colors):
-                step = (i + 1) * 10
-                print(f"  B{step}: {color}")
+            lines = [
+                *_list_block("GroupDark colors:", dark_colors),
+                *_list_block("\nGroupLight colors:", light_colors),
+            ]
+        print("\n".join(lines))
 
 
 def _run_analysis_if_needed(
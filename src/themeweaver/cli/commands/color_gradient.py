@@ -11,6 +11,7 @@ from typing import Any, List
 import yaml
 
 from themeweaver.cli.error_handling import operation_context
+from themeweaver.cli.utils import resolve_palette_name
 from themeweaver.color_utils.interpolation_analysis import analyze_interpolation
 from themeweaver.color_utils.interpolation_methods import (
     interpolate_colors,
@@ -124,17 +125,7 @@ def cmd_gradient(args: Any) -> None:
     elif args.output == "json":
         import json
 
-        # Determine palette name
-        if args.name:
-            palette_name = args.name
-        else:
-            from themeweaver.color_utils.color_names import (
-                get_palette_name_from_color,
-            )
-
-            palette_name = get_palette_name_from_color(
-                args.color, creative=not args.simple_names, quiet=True
-            )
+        palette_name = resolve_palette_name(args, args.color)
 
         # Generate B-step structure
         palette_data = {}
@@ -146,16 +137,7 @@ def cmd_gradient(args: Any) -> None:
         print(json.dumps(data, indent=2))
 
     elif args.output == "yaml":
-        if args.name:
-            palette_name = args.name
-        else:
-            from themeweaver.color_utils.color_names import (
-                get_palette_name_from_color,
-            )
-
-            palette_name = get_palette_name_from_color(
-                args.color, creative=not args.simple_names, quiet=True
-            )
+        palette_name = resolve_palette_name(args, args.color)
 
         # Normalize base color for comparison
         normalized_base_color = (
@@ -178,19 +160,19 @@ def cmd_gradient(args: Any) -> None:
             data[palette_name][f"B{step}"] = color
 
         # Add metadata as comments
-        yaml_output = f"""# Generated 16-color gradient from single color
-# Base color: {args.color}
-# Base color position: {base_color_position if base_color_position is not None else "N/A"} (0-15)
-# Method: {method_desc}
-# Total colors: 16
-"""
-
+        position = base_color_position if base_color_position is not None else "N/A"
+        lines = [
+            "# Generated 16-color gradient from single color",
+            f"# Base color: {args.color}",
+            f"# Base color position: {position} (0-15)",
+            f"# Method: {method_desc}",
+            "# Total colors: 16",
+        ]
         if args.method == "exponential":
-            yaml_output += f"# Exponent: {args.exponent}\n"
-
-        yaml_output += "\n"
-        yaml_output += yaml.dump(data, default_flow_style=False, sort_keys=False)
-        print(yaml_output)
+            lines.append(f"# Exponent: {args.exponent}")
+        lines.append("")
+        lines.append(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        print("\n".join(lines))
 
         # Show analysis if requested
         if args.analyze:
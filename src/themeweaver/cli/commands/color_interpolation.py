@@ -6,6 +6,7 @@ import logging
 from typing import Any
 
 from themeweaver.cli.error_handling import operation_context
+from themeweaver.cli.utils import resolve_palette_name
 from themeweaver.color_utils.interpolation_analysis import analyze_interpolation
 from themeweaver.color_utils.interpolation_methods import (
     interpolate_colors,
@@ -41,17 +42,7 @@ def cmd_interpolate(args: Any) -> None:
     elif args.output == "json":
         import json
 
-        # Determine palette name
-        if args.name:
-            palette_name = args.name
-        else:
-            from themeweaver.color_utils.color_names import (
-                get_palette_name_from_color,
-            )
-
-            palette_name = get_palette_name_from_color(
-                args.start_color, creative=not args.simple_names, quiet=True
-            )
+        palette_name = resolve_palette_name(args, args.start_color)
 
         # Generate B-step structure
         palette_data = {}
@@ -65,16 +56,7 @@ def cmd_interpolate(args: Any) -> None:
     elif args.output == "yaml":
         import yaml
 
-        if args.name:
-            palette_name = args.name
-        else:
-            from themeweaver.color_utils.color_names import (
-                get_palette_name_from_color,
-            )
-
-            palette_name = get_palette_name_from_color(
-                args.start_color, creative=not args.simple_names, quiet=True
-            )
+        palette_name = resolve_palette_name(args, args.start_color)
 
         # Create YAML structure
         data = {palette_name: {}}
@@ -83,16 +65,17 @@ def cmd_interpolate(args: Any) -> None:
             data[palette_name][f"B{step}"] = color
 
         # Add metadata as comments
-        yaml_output = f"""# Generated color gradient using {args.method} interpolation
-# From: {args.start_color} to {args.end_color}
-# Steps: {args.steps}"""
-
+        lines = [
+            f"# Generated color gradient using {args.method} interpolation",
+            f"# From: {args.start_color} to {args.end_color}",
+            f"# Steps: {args.steps}",
+        ]
         if args.method == "exponential":
-            yaml_output += f"\n# Exponent: {args.exponent}"
-
-        yaml_output += f"\n# Method: {args.method}\n\n"
-        yaml_output += yaml.dump(data, default_flow_style=False, sort_keys=False)
-        print(yaml_output)
+            lines.append(f"# Exponent: {args.exponent}")
+        lines.append(f"# Method: {args.method}")
+        lines.append("")
+        lines.append(yaml.dump(data, default_flow_style=False, sort_keys=False))
+        print("\n".join(lines))
 
     # Show analysis if requested (for any output format)
     if args.analyze:
@@ -4,7 +4,7 @@ Shared utilities for CLI commands.
 
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from themeweaver.core.colorsystem import load_theme_metadata_from_yaml
 from themeweaver.core.palette import create_palettes
@@ -22,6 +22,26 @@ def setup_logging():
     )
 
 
+def resolve_palette_name(args: Any, color: str) -> str:
+    """Return the palette name given with --name, or derive one from a color.
+
+    Args:
+        args: Parsed CLI arguments with ``name`` and ``simple_names``
+        color: Color to name the palette after when no name was given
+
+    Returns:
+        Palette name
+    """
+    if args.name:
+        return args.name
+
+    from themeweaver.color_utils.color_names import get_palette_name_from_color
+
+    return get_palette_name_from_color(
+        color, creative=not args.simple_names, quiet=True
+    )
+
+
 def list_themes(themes_dir: Optional[Path] = None) -> List[str]:
     """List all available themes.
 
@@ -8,30 +8,46 @@ using LCH color space and Delta E spacing for scientifically sound palettes.
 from themeweaver.color_utils.color_analysis import analyze_chromatic_distances
 from themeweaver.color_utils.color_generation import generate_theme_colors
 from themeweaver.color_utils.color_names import (
+    clear_color_name_cache,
+    compose_palette_name,
+    delete_cached_color_name,
     generate_random_adjective,
     get_color_name,
+    get_color_names_for_palettes,
     get_color_names_from_api,
     get_palette_name_from_color,
+    get_palette_names_from_colors,
     normalize_color_name_to_safe_ascii,
 )
 from themeweaver.color_utils.color_utils import (
+    ColorInfo,
     adjust_for_contrast,
     adjust_lch_to_gamut,
     blend_alpha,
     calculate_delta_e,
+    calculate_delta_e_batch,
+    calculate_delta_e_matrix,
     calculate_std_dev,
     contrast_ratio,
     find_max_in_gamut_chroma,
     get_color_info,
     hex_to_rgb,
+    hex_to_lch_batch,
+    hex_to_rgb_batch,
     hsv_to_rgb,
+    hsv_to_rgb_batch,
     is_color_dark,
+    is_color_dark_batch,
     is_lch_in_gamut,
     lch_to_hex,
+    lch_to_hex_batch,
     relative_luminance,
     rgb_to_hex,
+    rgb_to_hex_batch,
     rgb_to_hsv,
+    rgb_to_hsv_batch,
     rgb_to_lch,
+    rgb_to_lch_batch,
 )
 from themeweaver.color_utils.interpolation_methods import (
     circular_interpolate,
@@ -64,16 +80,27 @@ __all__ = [
     "blend_alpha",
     "contrast_ratio",
     "hex_to_rgb",
+    "hex_to_rgb_batch",
     "relative_luminance",
     "rgb_to_hex",
+    "rgb_to_hex_batch",
     "rgb_to_hsv",
+    "rgb_to_hsv_batch",
     "hsv_to_rgb",
+    "hsv_to_rgb_batch",
     "lch_to_hex",
+    "lch_to_hex_batch",
     "rgb_to_lch",
+    "rgb_to_lch_batch",
+    "hex_to_lch_batch",
     "calculate_delta_e",
+    "calculate_delta_e_batch",
+    "calculate_delta_e_matrix",
     "calculate_std_dev",
+    "ColorInfo",
     "get_color_info",
     "is_color_dark",
+    "is_color_dark_batch",
     "is_lch_in_gamut",
     "find_max_in_gamut_chroma",
     "adjust_lch_to_gamut",
@@ -98,9 +125,14 @@ __all__ = [
     # Color names
     "get_color_name",
     "get_color_names_from_api",
+    "get_color_names_for_palettes",
     "get_palette_name_from_color",
+    "get_palette_names_from_colors",
+    "compose_palette_name",
     "generate_random_adjective",
     "normalize_color_name_to_safe_ascii",
+    "clear_color_name_cache",
+    "delete_cached_color_name",
     # New palette generation
     "generate_lightness_gradient_from_color",
     "generate_palettes_from_color",
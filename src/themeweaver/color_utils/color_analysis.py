@@ -5,23 +5,31 @@ This module provides functions for analyzing color palettes,
 specifically chromatic distance analysis for perceptual quality assessment.
 """
 
+import math
 from typing import Dict, List, Optional
 
-from themeweaver.color_utils.color_utils import calculate_delta_e, calculate_std_dev
+from themeweaver.color_utils.color_utils import (
+    calculate_delta_e_batch,
+    calculate_std_dev,
+)
 
 
 def analyze_chromatic_distances(
-    colors: List[str], group_name: str = ""
+    colors: List[str], group_name: str = "", verbose: bool = True
 ) -> Optional[List[Dict[str, any]]]:
-    """Analyze chromatic distances between consecutive colors in a palette."""
+    """Analyze chromatic distances between consecutive colors in a palette.
+
+    When ``verbose`` is False the report is not printed; only the list of
+    distances is computed and returned.
+    """
 
     if len(colors) < 2:
         return None
 
     distances = []
-    for i in range(len(colors) - 1):
-        delta_e = calculate_delta_e(colors[i], colors[i + 1])
-        if delta_e is not None:
+    delta_es = calculate_delta_e_batch(colors[:-1], colors[1:]).tolist()
+    for i, delta_e in enumerate(delta_es):
+        if not math.isnan(delta_e):
             distances.append(
                 {
                     "from_color": colors[i],
@@ -31,6 +39,9 @@ def analyze_chromatic_distances(
                 }
             )
 
+    if not verbose:
+        return distances
+
     if group_name:
         print(f"\n=== Chromatic Distance Analysis: {group_name} ===")
 
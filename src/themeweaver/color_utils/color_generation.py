@@ -7,9 +7,41 @@ This module provides color generation using LCH color space with different strat
 """
 
 import math
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from themeweaver.color_utils.color_utils import lch_to_hex
+import numpy as np
+
+from themeweaver.color_utils.color_utils import lch_to_hex_batch
+
+# Golden ratio conjugate used to spread hues for maximum distinguishability
+_GOLDEN_RATIO = 0.618033988749895
+
+# Unwrapped golden ratio hue steps (i * 360 * ratio), shared by every palette.
+# Kept unreduced so that adding start_hue before the modulo gives the same hues
+# as computing each step on the fly.
+_GOLDEN_HUE_STEPS = np.arange(1024) * 360 * _GOLDEN_RATIO
+
+# Theme adjustments as (lightness offset, lightness bounds, chroma offset,
+# chroma bounds). Dark themes go slightly darker with higher chroma for
+# visibility; light themes go slightly brighter with moderate chroma.
+_THEME_ADJUSTMENTS = {
+    "dark": (-5, (15, math.inf), 10, (-math.inf, 120)),
+    "light": (8, (-math.inf, 95), 5, (-math.inf, 120)),
+}
+
+# Theme base parameters as (lightness, chroma, default start hue), taken from
+# the Spyder Group palette averages and B10 hues.
+_THEME_BASE_PARAMS = {
+    "dark": (58, 73, 37),
+    "light": (65, 71, 53),
+}
+
+# Lightness ranges used by generate_optimal_colors for each background.
+_OPTIMAL_LIGHTNESS_RANGES = {
+    "dark": (40, 75),
+    "light": (60, 90),
+}
 
 
 def generate_uniform_colors(
@@ -32,21 +64,16 @@ def generate_uniform_colors(
     Returns:
         List of hex color codes
     """
-    colors = []
     hue_step = 360 / num_colors  # Uniform steps
+    hues = np.mod(start_hue + np.arange(num_colors) * hue_step, 360)
 
-    for i in range(num_colors):
-        current_hue = (start_hue + i * hue_step) % 360
-        current_lch = [base_lightness, base_chroma, current_hue]
-
-        # Apply theme-specific adjustments
-        adjusted_lch = apply_theme_adjustments(current_lch, theme)
+    # Theme adjustments only touch lightness and chroma, which are the same
+    # for every color, so they are computed once for the whole palette
+    lightness, chroma, _ = apply_theme_adjustments(
+        [base_lightness, base_chroma, 0], theme
+    )
 
-        # Generate color
-        color_hex = lch_to_hex(adjusted_lch[0], adjusted_lch[1], adjusted_lch[2])
-        colors.append(color_hex)
-
-    return colors
+    return lch_to_hex_batch(lightness, chroma, hues)
 
 
 def apply_theme_adjustments(lch: List[float], theme: str) -> List[float]:
@@ -61,20 +88,54 @@ def apply_theme_adjustments(lch: List[float], theme: str) -> List[float]:
         list: Adjusted LCH values
     """
     lightness, chroma, hue = lch
+    l_offset, (l_min, l_max), c_offset, (c_min, c_max) = _get_theme_adjustments(theme)
 
-    # Simple adjustments based on theme
-    if theme == "dark":
-        # Dark theme: slightly darker, higher chroma for visibility
-        adjusted_lightness = max(15, lightness - 5)
-        adjusted_chroma = min(120, chroma + 10)
-    else:
-        # Light theme: slightly brighter, moderate chroma
-        adjusted_lightness = min(95, lightness + 8)
-        adjusted_chroma = min(120, chroma + 5)
+    adjusted_lightness = min(max(lightness + l_offset, l_min), l_max)
+    adjusted_chroma = min(max(chroma + c_offset, c_min), c_max)
 
     return [adjusted_lightness, adjusted_chroma, hue]
 
 
+def apply_theme_adjustments_batch(
+    lightness: np.ndarray, chroma: np.ndarray, theme: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Array version of apply_theme_adjustments for whole palettes.
+
+    Args:
+        lightness: Array of lightness values
+        chroma: Array of chroma values
+        theme: 'dark' or 'light' theme
+
+    Returns:
+        tuple: (adjusted_lightness, adjusted_chroma) arrays
+    """
+    l_offset, l_bounds, c_offset, c_bounds = _get_theme_adjustments(theme)
+    return (
+        np.clip(lightness + l_offset, *l_bounds),
+        np.clip(chroma + c_offset, *c_bounds),
+    )
+
+
+def _get_theme_adjustments(theme: str) -> tuple:
+    """Look up the adjustment table entry, treating unknown themes as light."""
+    return _THEME_ADJUSTMENTS[_theme_key(theme)]
+
+
+def _theme_key(theme: str) -> str:
+    """Map a theme name to a parameter table key; anything but dark is light."""
+    return "dark" if theme == "dark" else "light"
+
+
+def _golden_ratio_hues(num_colors: int, start_hue: float = 0) -> np.ndarray:
+    """Spread hues around the color wheel in golden ratio steps from start_hue."""
+    if num_colors <= len(_GOLDEN_HUE_STEPS):
+        steps = _GOLDEN_HUE_STEPS[:num_colors]
+    else:
+        steps = np.arange(num_colors) * 360 * _GOLDEN_RATIO
+    return np.mod(start_hue + steps, 360)
+
+
 def generate_theme_colors(
     theme: str = "dark",
     num_colors: int = 12,
@@ -93,20 +154,25 @@ def generate_theme_colors(
     Returns:
         List of hex color codes
     """
+    # Palettes are deterministic in their arguments; hand out a fresh list so
+    # callers can't mutate the cached palette
+    return list(_generate_theme_colors_cached(theme, num_colors, start_hue, uniform))
+
+
+@lru_cache(maxsize=128)
+def _generate_theme_colors_cached(
+    theme: str, num_colors: int, start_hue: Optional[float], uniform: bool
+) -> Tuple[str, ...]:
+    """Cached implementation of generate_theme_colors()."""
     # Get theme-optimized parameters
-    if theme == "dark":
-        base_lightness = 58  # From Spyder Group dark palette average
-        base_chroma = 73  # From Spyder Group dark palette average
-        default_start_hue = 37  # Close to Spyder Group B10 hue
-    else:  # light theme
-        base_lightness = 65  # From Spyder Group light palette average
-        base_chroma = 71  # From Spyder Group light palette average
-        default_start_hue = 53  # Close to Spyder Group B10 hue
+    base_lightness, base_chroma, default_start_hue = _THEME_BASE_PARAMS[
+        _theme_key(theme)
+    ]
 
     actual_start_hue = start_hue if start_hue is not None else default_start_hue
 
     if uniform:
-        return generate_uniform_colors(
+        colors = generate_uniform_colors(
             num_colors,
             actual_start_hue,
             base_lightness,
@@ -115,13 +181,14 @@ def generate_theme_colors(
         )
     else:
         # Use golden ratio distribution for better distinguishability
-        return generate_golden_ratio_colors(
+        colors = generate_golden_ratio_colors(
             num_colors,
             actual_start_hue,
             base_lightness,
             base_chroma,
             theme,
         )
+    return tuple(colors)
 
 
 def generate_golden_ratio_colors(
@@ -144,29 +211,22 @@ def generate_golden_ratio_colors(
     Returns:
         List of hex color codes
     """
-    colors = []
-    golden_ratio = 0.618033988749895
+    indices = np.arange(num_colors)
 
-    for i in range(num_colors):
-        # Use golden ratio for hue distribution
-        hue = (start_hue + (i * 360 * golden_ratio)) % 360
+    # Use golden ratio for hue distribution
+    hues = _golden_ratio_hues(num_colors, start_hue)
 
-        # Vary lightness slightly for better distinguishability
-        lightness_variation = 0.5 + 0.3 * math.sin(i * 1.5)
-        lightness = base_lightness + (lightness_variation - 0.5) * 20
+    # Vary lightness slightly for better distinguishability
+    lightness_variation = 0.5 + 0.3 * np.sin(indices * 1.5)
+    lightnesses = base_lightness + (lightness_variation - 0.5) * 20
 
-        # Vary chroma slightly
-        chroma_variation = 0.8 + 0.4 * math.cos(i * 0.8)
-        chroma = base_chroma * chroma_variation
+    # Vary chroma slightly
+    chromas = base_chroma * (0.8 + 0.4 * np.cos(indices * 0.8))
 
-        current_lch = [lightness, chroma, hue]
-        adjusted_lch = apply_theme_adjustments(current_lch, theme)
+    lightnesses, chromas = apply_theme_adjustments_batch(lightnesses, chromas, theme)
 
-        # Generate color
-        color_hex = lch_to_hex(adjusted_lch[0], adjusted_lch[1], adjusted_lch[2])
-        colors.append(color_hex)
-
-    return colors
+    # Generate colors
+    return lch_to_hex_batch(lightnesses, chromas, hues)
 
 
 def generate_optimal_colors(
@@ -186,55 +246,58 @@ def generate_optimal_colors(
     Returns:
         List of hex color codes optimized for distinguishability
     """
-    # Use golden ratio for wider hue distribution
-    golden_ratio = 0.618033988749895
+    return list(_generate_optimal_colors_cached(num_colors, theme, start_hue))
 
+
+@lru_cache(maxsize=128)
+def _generate_optimal_colors_cached(
+    num_colors: int, theme: str, start_hue: Optional[float]
+) -> Tuple[str, ...]:
+    """Cached implementation of generate_optimal_colors()."""
     # Define lightness ranges for better variation
-    if theme == "dark":
-        lightness_range = (40, 75)  # Good range for dark backgrounds
-    else:
-        lightness_range = (60, 90)  # Good range for light backgrounds
+    lightness_range = _OPTIMAL_LIGHTNESS_RANGES[_theme_key(theme)]
 
     # Base chroma - start high for better distinguishability
     base_chroma = 85
 
-    colors = []
-
-    for i in range(num_colors):
-        if start_hue is not None:
-            # Use start_hue as the first color, then distribute from there
-            if i == 0:
-                hue = start_hue
-            else:
-                # Continue golden ratio distribution from start_hue
-                hue = (start_hue + (i * 360 * golden_ratio)) % 360
-        else:
-            # Calculate hue using golden ratio for optimal distribution
-            hue = (i * 360 * golden_ratio) % 360
-
-        # Vary lightness using sinusoidal function for natural distribution
-        lightness_variation = 0.5 + 0.4 * math.sin(i * 1.8)
-        lightness = (
-            lightness_range[0]
-            + (lightness_range[1] - lightness_range[0]) * lightness_variation
-        )
-
-        # Vary chroma based on hue for better distinguishability
-        # More chroma for hues that are typically less saturated
-        h_factor = 1.0
-        if 60 <= hue <= 180:  # Greens/cyan typically need more chroma
-            h_factor = 1.3
-        elif 180 <= hue <= 240:  # Blues
-            h_factor = 1.2
-        elif 240 <= hue <= 300:  # Magentas
-            h_factor = 1.1
-
-        # Dynamic chroma variation
-        chroma_variation = 0.8 + 0.4 * math.cos(i * 0.9)
-        chroma = min(120, base_chroma * h_factor * chroma_variation)
-
-        # Generate color
-        color_hex = lch_to_hex(lightness, chroma, hue)
-        colors.append(color_hex)
-
-    return colors
+    indices = np.arange(num_colors)
+    # Use golden ratio for wider hue distribution
+    if start_hue is not None:
+        # Use start_hue as the first color, then continue the golden ratio
+        # distribution from there
+        hues = _golden_ratio_hues(num_colors, start_hue)
+        hues[:1] = start_hue
+    else:
+        # Calculate hue using golden ratio for optimal distribution
+        hues = _golden_ratio_hues(num_colors)
+
+    # Vary lightness using sinusoidal function for natural distribution
+    lightness_variation = 0.5 + 0.4 * np.sin(indices * 1.8)
+    lightnesses = (
+        lightness_range[0]
+        + (lightness_range[1] - lightness_range[0]) * lightness_variation
+    )
+
+    # Vary chroma based on hue for better distinguishability
+    h_factor = _hue_chroma_factors(hues)
+
+    # Dynamic chroma variation
+    chroma_variation = 0.8 + 0.4 * np.cos(indices * 0.9)
+    chromas = np.minimum(120, base_chroma * h_factor * chroma_variation)
+
+    # Generate colors
+    return tuple(lch_to_hex_batch(lightnesses, chromas, hues))
+
+
+def _hue_chroma_factors(hues: np.ndarray) -> np.ndarray:
+    """Return the chroma boost for hues that are typically less saturated."""
+    # np.select takes the first matching condition, like an if/elif chain
+    return np.select(
+        [
+            (hues >= 60) & (hues <= 180),  # Greens/cyan typically need more chroma
+            (hues >= 180) & (hues <= 240),  # Blues
+            (hues >= 240) & (hues <= 300),  # Magentas
+        ],
+        [1.3, 1.2, 1.1],
+        default=1.0,
+    )
@@ -12,16 +12,46 @@ Example:
 'Red'
 """
 
+import gzip
 import json
 import logging
-import re
+import os
+import random
+import sqlite3
+import time
 import unicodedata
 import urllib.parse
 import urllib.request
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 _logger = logging.getLogger(__name__)
 
+# Color names rarely change upstream, so cached lookups stay valid for a month
+COLOR_NAME_CACHE_TTL = 30 * 24 * 60 * 60
+
+# In-process tier of the color name cache, keyed by ("#RRGGBB", list_type)
+_color_name_memory_cache: Dict[Tuple[str, str], str] = {}
+
+# Hexes per cache lookup query; with the list type and expiry time this stays
+# within the 999 bound variables older SQLite builds allow
+_CACHE_MAX_HEXES_PER_QUERY = 997
+
+# Persistent cache files whose table this process has already created
+_color_name_cache_schemas: Set[Path] = set()
+
+# Every byte that is not an ASCII letter or digit, deleted from color names
+_NON_ALNUM_BYTES = bytes(
+    byte for byte in range(256) if not (chr(byte).isascii() and chr(byte).isalnum())
+)
+
+# Colors per color.pizza request, and how many requests may run at once
+_API_MAX_COLORS_PER_REQUEST = 100
+_API_MAX_WORKERS = 4
+
 
 def normalize_color_name_to_safe_ascii(name: str) -> str:
     """Strip API color names down to ASCII letters and digits (valid in Python identifiers).
@@ -33,8 +63,19 @@ def normalize_color_name_to_safe_ascii(name: str) -> str:
     if not name or not str(name).strip():
         return ""
     nfkd = unicodedata.normalize("NFKD", str(name).strip())
-    ascii_only = nfkd.encode("ascii", "ignore").decode("ascii")
-    return re.sub(r"[^A-Za-z0-9]", "", ascii_only)
+    ascii_only = nfkd.encode("ascii", "ignore")
+    return ascii_only.translate(None, _NON_ALNUM_BYTES).decode("ascii")
+
+
+def _normalize_hex(hex_color: str) -> str:
+    """Return a hex color as "#RRGGBB" (uppercase), reusing normalized strings."""
+    if (
+        hex_color[:1] == "#"
+        and hex_color[1:2] != "#"
+        and (hex_color.isupper() or hex_color[1:].isdigit())
+    ):
+        return hex_color
+    return "#" + hex_color.lstrip("#").upper()
 
 
 def _http_user_agent() -> str:
@@ -49,6 +90,136 @@ def _http_user_agent() -> str:
     return f"Themeweaver/{ver} (color names; +https://github.com/conradolandia/spyder-themeweaver)"
 
 
+def _color_name_cache_path() -> Path:
+    """Location of the persistent color name cache (honors XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "themeweaver" / "color_names.sqlite"
+
+
+def _open_color_name_cache(create: bool = False) -> Optional[sqlite3.Connection]:
+    """Open the persistent cache, or None if it can't be used on this system.
+
+    Only writers pass create=True; lookups never create the cache directory or
+    file, and the table is created once per cache path.
+    """
+    try:
+        path = _color_name_cache_path()
+        if not create:
+            return sqlite3.connect(path) if path.exists() else None
+        if path in _color_name_cache_schemas and path.exists():
+            return sqlite3.connect(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS color_names ("
+            "hex TEXT, list_type TEXT, name TEXT, expires_at REAL, "
+            "PRIMARY KEY (hex, list_type))"
+        )
+        _color_name_cache_schemas.add(path)
+        return connection
+    except (OSError, sqlite3.Error) as e:
+        _logger.debug("Color name cache unavailable: %s", e)
+        return None
+
+
+def _get_cached_color_names(
+    hex_values: Iterable[str], list_type: str
+) -> Dict[str, str]:
+    """Look up "#RRGGBB" values in the memory cache, then on disk."""
+    names = {}
+    missing = []
+    for hex_value in hex_values:
+        cached = _color_name_memory_cache.get((hex_value, list_type))
+        if cached is None:
+            missing.append(hex_value)
+        else:
+            names[hex_value] = cached
+
+    if not missing:
+        return names
+
+    connection = _open_color_name_cache()
+    if connection is None:
+        return names
+
+    rows = []
+    now = time.time()
+    with closing(connection):
+        try:
+            # Batched so no query binds more variables than SQLite allows
+            for i in range(0, len(missing), _CACHE_MAX_HEXES_PER_QUERY):
+                batch = missing[i : i + _CACHE_MAX_HEXES_PER_QUERY]
+                placeholders = ",".join("?" * len(batch))
+                rows += connection.execute(
+                    "SELECT hex, name FROM color_names WHERE list_type = ? "
+                    f"AND expires_at > ? AND hex IN ({placeholders})",
+                    (list_type, now, *batch),
+                ).fetchall()
+        except sqlite3.Error as e:
+            _logger.debug("Color name cache lookup failed: %s", e)
+
+    for hex_value, name in rows:
+        names[hex_value] = name
+        _color_name_memory_cache[(hex_value, list_type)] = name
+    return names
+
+
+def _store_color_names(color_names: Dict[str, str], list_type: str) -> None:
+    """Write API results to both cache tiers."""
+    for hex_value, name in color_names.items():
+        _color_name_memory_cache[(hex_value, list_type)] = name
+
+    connection = _open_color_name_cache(create=True)
+    if connection is None:
+        return
+
+    expires_at = time.time() + COLOR_NAME_CACHE_TTL
+    with closing(connection):
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO color_names VALUES (?, ?, ?, ?)",
+                    [
+                        (hex_value, list_type, name, expires_at)
+                        for hex_value, name in color_names.items()
+                    ],
+                )
+        except sqlite3.Error as e:
+            _logger.debug("Color name cache write failed: %s", e)
+
+
+def clear_color_name_cache() -> None:
+    """Forget every cached color name, in memory and on disk."""
+    _color_name_memory_cache.clear()
+    connection = _open_color_name_cache()
+    if connection is None:
+        return
+    with closing(connection):
+        try:
+            with connection:
+                connection.execute("DELETE FROM color_names")
+        except sqlite3.Error as e:
+            _logger.debug("Color name cache clear failed: %s", e)
+
+
+def delete_cached_color_name(hex_color: str) -> None:
+    """Forget the cached names of one hex color (for every list type)."""
+    hex_value = _normalize_hex(hex_color)
+    for key in [key for key in _color_name_memory_cache if key[0] == hex_value]:
+        del _color_name_memory_cache[key]
+    connection = _open_color_name_cache()
+    if connection is None:
+        return
+    with closing(connection):
+        try:
+            with connection:
+                connection.execute(
+                    "DELETE FROM color_names WHERE hex = ?", (hex_value,)
+                )
+        except sqlite3.Error as e:
+            _logger.debug("Color name cache delete failed: %s", e)
+
+
 try:
     import randomname
 
@@ -56,12 +227,18 @@ try:
 except ImportError:
     RANDOMNAME_AVAILABLE = False
 
+# Adjective categories used for creative palette names
+_ADJECTIVE_CATEGORIES = ("character", "speed", "algorithms", "physics")
+
 
 def get_color_names_from_api(
     hex_colors: List[str], list_type: str = "bestOf", quiet: bool = False
 ) -> Dict[str, str]:
     """Get color names from the color.pizza API for multiple colors.
 
+    Names are cached in memory and in a persistent store under the user cache
+    directory; only colors missing from the cache are requested from the API.
+
     Args:
         hex_colors: List of hex color strings (with or without #)
         list_type: API list type ('bestOf', 'wikipedia', 'ntc', etc.)
@@ -73,65 +250,153 @@ def get_color_names_from_api(
     if not hex_colors:
         return {}
 
-    # Clean hex colors (remove # and convert to lowercase)
-    clean_colors = []
-    for color in hex_colors:
-        clean_color = color.lstrip("#").lower()
-        if len(clean_color) == 6:  # Valid hex color
-            clean_colors.append(clean_color)
+    # Normalize to "#RRGGBB" once; repeated colors only need one lookup
+    hex_values = list(
+        dict.fromkeys(
+            hex_value
+            for hex_value in map(_normalize_hex, hex_colors)
+            if len(hex_value) == 7  # Valid hex color
+        )
+    )
 
-    if not clean_colors:
+    if not hex_values:
         return {}
 
+    # Serve what we can from the cache and only ask the API for the rest
+    cached_names = _get_cached_color_names(hex_values, list_type)
+    # The API takes lowercase digits without #
+    uncached_colors = [
+        hex_value[1:].lower()
+        for hex_value in hex_values
+        if hex_value not in cached_names
+    ]
+    if not uncached_colors:
+        return cached_names
+
+    # Long palettes are split so no single URL grows past proxy limits
+    chunks = [
+        uncached_colors[i : i + _API_MAX_COLORS_PER_REQUEST]
+        for i in range(0, len(uncached_colors), _API_MAX_COLORS_PER_REQUEST)
+    ]
+
+    if not quiet:
+        _logger.info("🌈 Fetching color names from API...")
+
+    # A failed chunk only loses its own colors; every chunk that succeeded is
+    # still returned and cached
+    color_names = {}
+    failed = 0
+    if len(chunks) == 1:
+        try:
+            color_names.update(_request_color_names(chunks[0], list_type))
+        except Exception as e:
+            failed += 1
+            _logger.error("❌ API request failed: %s", e)
+    else:
+        with ThreadPoolExecutor(max_workers=_API_MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(_request_color_names, chunk, list_type)
+                for chunk in chunks
+            ]
+            for future in futures:
+                try:
+                    color_names.update(future.result())
+                except Exception as e:
+                    failed += 1
+                    _logger.error("❌ API request failed: %s", e)
+
+    if color_names:
+        _store_color_names(color_names, list_type)
+    if not quiet and failed < len(chunks):
+        _logger.info("✅ Retrieved %d color names", len(color_names))
+    return {**cached_names, **color_names}
+
+
+def _request_color_names(clean_colors: List[str], list_type: str) -> Dict[str, str]:
+    """Request names for hex colors (lowercase, without #) in one API call."""
     # Build API URL
     base_url = "https://api.color.pizza/v1/"
     params = {"values": ",".join(clean_colors), "list": list_type}
 
     url = f"{base_url}?{urllib.parse.urlencode(params)}"
+    started = time.perf_counter()
+
+    # Make API request (must set User-Agent: default urllib UA is blocked with 403 by Cloudflare)
+    request = urllib.request.Request(
+        url,
+        headers={"User-Agent": _http_user_agent(), "Accept-Encoding": "gzip"},
+    )
+    with urllib.request.urlopen(request, timeout=10) as response:
+        data = _read_json_response(response)
+
+    # Parse response
+    color_names = {}
+    if "colors" in data:
+        for color_info in data["colors"]:
+            # Use requestedHex if available, otherwise use hex
+            requested_hex = color_info.get("requestedHex", "")
+            if not requested_hex:
+                requested_hex = color_info.get("hex", "")
+
+            # Normalize the hex value
+            if requested_hex and not requested_hex.startswith("#"):
+                requested_hex = "#" + requested_hex
+            hex_value = requested_hex.upper()
+
+            raw_name = color_info.get("name", "")
+            if not hex_value or not raw_name:
+                continue
+            safe_name = normalize_color_name_to_safe_ascii(raw_name)
+            if not safe_name:
+                # e.g. name was only non-Latin script; keep a deterministic ASCII label
+                hex_digits = hex_value.lstrip("#").upper()
+                safe_name = f"Color{hex_digits}"
+            color_names[hex_value] = safe_name
+
+    _logger.debug(
+        "Fetched %d color names in %.3fs",
+        len(clean_colors),
+        time.perf_counter() - started,
+    )
+    return color_names
+
+
+def _read_json_response(response) -> dict:
+    """Parse a JSON HTTP response body, decompressing it if it was gzipped."""
+    body = response.read()
+    if response.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    # json.loads() detects the UTF encoding of bytes itself
+    return json.loads(body)
+
+
+def get_color_names_for_palettes(
+    palettes: List[List[str]], list_type: str = "bestOf", quiet: bool = False
+) -> List[Dict[str, str]]:
+    """Get color names for several palettes with one combined API request.
 
-    try:
-        if not quiet:
-            _logger.info("🌈 Fetching color names from API...")
+    Args:
+        palettes: One list of hex color strings per palette
+        list_type: API list type ('bestOf', 'wikipedia', 'ntc', etc.)
+        quiet: If True, suppress informational logging
 
-        # Make API request (must set User-Agent: default urllib UA is blocked with 403 by Cloudflare)
-        request = urllib.request.Request(
-            url,
-            headers={"User-Agent": _http_user_agent()},
+    Returns:
+        One dict per palette mapping its hex colors to their names
+    """
+    all_colors = [color for palette in palettes for color in palette]
+    names = get_color_names_from_api(all_colors, list_type=list_type, quiet=quiet)
+
+    palette_names = []
+    for palette in palettes:
+        normalized = map(_normalize_hex, palette)
+        palette_names.append(
+            {
+                hex_value: names[hex_value]
+                for hex_value in normalized
+                if hex_value in names
+            }
         )
-        with urllib.request.urlopen(request, timeout=10) as response:
-            data = json.loads(response.read().decode())
-
-        # Parse response
-        color_names = {}
-        if "colors" in data:
-            for color_info in data["colors"]:
-                # Use requestedHex if available, otherwise use hex
-                requested_hex = color_info.get("requestedHex", "")
-                if not requested_hex:
-                    requested_hex = color_info.get("hex", "")
-
-                # Normalize the hex value
-                if requested_hex and not requested_hex.startswith("#"):
-                    requested_hex = "#" + requested_hex
-                hex_value = requested_hex.upper()
-
-                raw_name = color_info.get("name", "")
-                if not hex_value or not raw_name:
-                    continue
-                safe_name = normalize_color_name_to_safe_ascii(raw_name)
-                if not safe_name:
-                    # e.g. name was only non-Latin script; keep a deterministic ASCII label
-                    hex_digits = hex_value.lstrip("#").upper()
-                    safe_name = f"Color{hex_digits}"
-                color_names[hex_value] = safe_name
-
-        if not quiet:
-            _logger.info("✅ Retrieved %d color names", len(color_names))
-        return color_names
-
-    except Exception as e:
-        _logger.error("❌ API request failed: %s", e)
-        return {}
+    return palette_names
 
 
 def get_color_name(hex_color: str, quiet: bool = False) -> Optional[str]:
@@ -144,10 +409,7 @@ def get_color_name(hex_color: str, quiet: bool = False) -> Optional[str]:
     Returns:
         Color name string, or None if not found
     """
-    # Normalize hex color
-    if not hex_color.startswith("#"):
-        hex_color = "#" + hex_color
-    hex_color = hex_color.upper()
+    hex_color = _normalize_hex(hex_color)
 
     # Get color name from API
     result = get_color_names_from_api([hex_color], quiet=quiet)
@@ -166,12 +428,12 @@ def generate_random_adjective() -> str:
 
     try:
         # Try different adjective categories for variety
-        categories = ["character", "speed", "algorithms", "physics"]
-        import random
-
-        category = random.choice(categories)
-
-        adjective = randomname.generate(f"adj/{category}")
+        category = random.choice(_ADJECTIVE_CATEGORIES)
+        try:
+            adjective = random.choice(_adjective_words(category))
+        except AttributeError:
+            # randomname.util.load is internal; fall back to the public API
+            adjective = randomname.generate(f"adj/{category}")
         return adjective.title()  # Capitalize first letter
 
     except Exception as e:
@@ -179,6 +441,19 @@ def generate_random_adjective() -> str:
         return "Creative"
 
 
+@lru_cache(maxsize=None)
+def _adjective_words(category: str) -> Tuple[str, ...]:
+    """Load a randomname adjective list once, with spaces joined as generate() does.
+
+    Uses the internal randomname.util.load (randomname is pinned to <0.3);
+    generate_random_adjective() falls back to randomname.generate() if a newer
+    release drops it.
+    """
+    return tuple(
+        word.replace(" ", "-") for word in randomname.util.load(f"adj/{category}")
+    )
+
+
 def get_palette_name_from_color(
     hex_color: str, creative: bool = True, quiet: bool = False
 ) -> str:
@@ -194,7 +469,52 @@ def get_palette_name_from_color(
         Palette name (cleaned for use in file names)
     """
     color_name = get_color_name(hex_color, quiet=quiet)
+    return compose_palette_name(hex_color, color_name, creative, quiet)
+
+
+def get_palette_names_from_colors(
+    hex_colors: List[str], creative: bool = True, quiet: bool = False
+) -> Dict[str, str]:
+    """Get palette names for several colors with a single API request.
+
+    Same naming rules as get_palette_name_from_color(), but the color names
+    for the whole list are fetched in one round-trip.
+
+    Args:
+        hex_colors: Hex color strings (e.g., ["#FF0000", "#00FF00"])
+        creative: If True, adds a random adjective prefix to each name
+        quiet: If True, suppress informational logging
 
+    Returns:
+        Dict mapping each input hex color to its palette name
+    """
+    api_names = get_color_names_from_api(hex_colors, quiet=quiet)
+    palette_names = {}
+    for hex_color in dict.fromkeys(hex_colors):
+        normalized = _normalize_hex(hex_color)
+        palette_names[hex_color] = compose_palette_name(
+            hex_color, api_names.get(normalized), creative, quiet
+        )
+    return palette_names
+
+
+def compose_palette_name(
+    hex_color: str,
+    color_name: Optional[str],
+    creative: bool = True,
+    quiet: bool = False,
+) -> str:
+    """Turn a color name (e.g. from the API) into a palette name.
+
+    Args:
+        hex_color: Hex color string the name belongs to
+        color_name: Color name, or None to fall back to the hex digits
+        creative: If True, adds a random adjective prefix
+        quiet: If True, suppress informational logging
+
+    Returns:
+        Palette name (cleaned for use in file names)
+    """
     if color_name:
         clean_color_name = normalize_color_name_to_safe_ascii(color_name)
         if not clean_color_name:
@@ -218,3 +538,20 @@ def get_palette_name_from_color(
             return f"{adjective}{fallback_name}"
         else:
             return fallback_name
+
+
+# Export functions
+__all__ = [
+    "COLOR_NAME_CACHE_TTL",
+    "RANDOMNAME_AVAILABLE",
+    "clear_color_name_cache",
+    "compose_palette_name",
+    "delete_cached_color_name",
+    "generate_random_adjective",
+    "get_color_name",
+    "get_color_names_for_palettes",
+    "get_color_names_from_api",
+    "get_palette_name_from_color",
+    "get_palette_names_from_colors",
+    "normalize_color_name_to_safe_ascii",
+]
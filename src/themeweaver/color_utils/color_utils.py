@@ -20,33 +20,130 @@ CIELab vs CIELCh Usage:
 """
 
 import colorsys
-from typing import List, Optional, Tuple
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
 import colorspacious
-
-
+import numpy as np
+
+# sRGB (IEC 61966-2-1) and D65 white point constants, identical to the ones
+# colorspacious uses. The sRGB -> LCH kernels below agree with cspace_convert
+# exactly; LCH -> sRGB uses NumPy's power and may differ by about 1 ulp, which
+# can flip in-gamut verdicts for colors sitting exactly on the gamut boundary
+_XYZ100_TO_SRGB1_MATRIX = np.array(
+    [
+        [3.2406, -1.5372, -0.4986],
+        [-0.9689, 1.8758, 0.0415],
+        [0.0557, -0.2040, 1.0570],
+    ]
+)
+_SRGB1_TO_XYZ100_MATRIX = np.linalg.inv(_XYZ100_TO_SRGB1_MATRIX)
+_D65_XYZ100 = np.array([95.047, 100.0, 108.883])
+
+# CIELab f^-1 switches from linear to cubic above this value
+_LAB_DELTA = 6.0 / 29
+
+# Two-digit uppercase hex for every channel value, as rgb_to_hex() formats them
+_HEX_BYTES = tuple(f"{i:02X}" for i in range(256))
+
+# Nibble value of every ASCII byte: 0-15 for hex digits, -1 for anything else
+_HEX_NIBBLES = np.full(256, -1, dtype=np.int16)
+for _digits, _start in ((b"0123456789", 0), (b"abcdef", 10), (b"ABCDEF", 10)):
+    _HEX_NIBBLES[np.frombuffer(_digits, dtype=np.uint8)] = np.arange(
+        _start, _start + len(_digits)
+    )
+
+# Lightness offsets +1, -1, +2, -2, ..., +49, -49 in nearest-first order
+_NEAREST_LIGHTNESS_OFFSETS = np.repeat(np.arange(1, 50), 2) * np.tile([1, -1], 49)
+
+
+@lru_cache(maxsize=4096)
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
-    """Convert hex to RGB (0-255)."""
+    """Convert hex to RGB (0-255) (memoized, since the conversion is pure)."""
     hex_color = hex_color.lstrip("#")
     if len(hex_color) != 6:
         raise ValueError(f"Invalid hex color: #{hex_color}. Must be 6 characters.")
     try:
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        rgb = bytes.fromhex(hex_color)
     except ValueError:
+        rgb = b""
+    # bytes.fromhex() skips whitespace, so "FF 00 " would yield fewer than 3 bytes
+    if len(rgb) != 3:
         raise ValueError(
             f"Invalid hex color: #{hex_color}. Must contain only hex digits."
         )
+    return rgb[0], rgb[1], rgb[2]
 
 
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     """Convert RGB to hex."""
-    return "#{:02X}{:02X}{:02X}".format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
+    r, g, b = int(rgb[0]), int(rgb[1]), int(rgb[2])
+    if 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+        return "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b]
+    # Out-of-range channels keep the plain formatting they always had
+    return "#{:02X}{:02X}{:02X}".format(r, g, b)
+
+
+def hex_to_rgb_batch(hex_colors: Sequence[str]) -> np.ndarray:
+    """
+    Convert hex colors to an (N, 3) uint8 RGB array in one vectorized pass.
+
+    Accepts the same formats as hex_to_rgb() and raises ValueError on the first
+    invalid color.
+    """
+    rgb, valid = _parse_hex_array(hex_colors)
+    if not valid.all():
+        invalid = hex_colors[int(np.argmin(valid))]
+        raise ValueError(f"Invalid hex color: {invalid}")
+    return rgb.astype(np.uint8)
+
+
+def rgb_to_hex_batch(rgb: np.ndarray) -> List[str]:
+    """Convert an (N, 3) array of RGB (0-255) values to hex colors."""
+    rgb = np.asarray(rgb).reshape(-1, 3).astype(int)
+    if ((rgb < 0) | (rgb > 255)).any():
+        raise ValueError("RGB values must be in the 0-255 range")
+    return [
+        "#" + _HEX_BYTES[r] + _HEX_BYTES[g] + _HEX_BYTES[b] for r, g, b in rgb.tolist()
+    ]
+
+
+def _parse_hex_array(hex_colors: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode hex colors nibble by nibble; returns (N, 3) RGB and a validity mask."""
+    digits = [
+        color.lstrip("#") if isinstance(color, str) else "" for color in hex_colors
+    ]
+    valid = np.array([len(d) == 6 and d.isascii() for d in digits], dtype=bool)
+    buffer = "".join(d if ok else "000000" for d, ok in zip(digits, valid.tolist()))
+    chars = np.frombuffer(buffer.encode("ascii"), dtype=np.uint8).reshape(-1, 6)
+    nibbles = _HEX_NIBBLES[chars]
+    valid &= (nibbles >= 0).all(axis=1)
+    return (nibbles[:, 0::2] << 4) | nibbles[:, 1::2], valid
 
 
 def rgb_to_hsv(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
     """Convert RGB (0-255) to HSV (0-1)."""
-    r, g, b = [x / 255.0 for x in rgb]
-    return colorsys.rgb_to_hsv(r, g, b)
+    r = rgb[0] / 255.0
+    g = rgb[1] / 255.0
+    b = rgb[2] / 255.0
+    # Same arithmetic as colorsys.rgb_to_hsv(), inlined to skip the extra call
+    maxc = max(r, g, b)
+    minc = min(r, g, b)
+    if minc == maxc:
+        return 0.0, 0.0, maxc
+    rangec = maxc - minc
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    if r == maxc:
+        h = bc - gc
+    elif g == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    return (h / 6.0) % 1.0, rangec / maxc, maxc
 
 
 def hsv_to_rgb(hsv: Tuple[float, float, float]) -> Tuple[int, int, int]:
@@ -55,29 +152,222 @@ def hsv_to_rgb(hsv: Tuple[float, float, float]) -> Tuple[int, int, int]:
     return tuple(int(x * 255) for x in (r, g, b))
 
 
+def rgb_to_hsv_batch(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of RGB (0-255) values to an (N, 3) HSV (0-1) array.
+
+    Vectorized rgb_to_hsv() with the same arithmetic, so rows match it exactly.
+    """
+    r, g, b = (np.asarray(rgb).reshape(-1, 3) / 255.0).T
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    gray = minc == maxc
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rc = (maxc - r) / rangec
+        gc = (maxc - g) / rangec
+        bc = (maxc - b) / rangec
+        hue = np.select([r == maxc, g == maxc], [bc - gc, 2.0 + rc - bc], 4.0 + gc - rc)
+        saturation = rangec / maxc
+    hue = np.where(gray, 0.0, (hue / 6.0) % 1.0)
+    saturation = np.where(gray, 0.0, saturation)
+    return np.column_stack([hue, saturation, maxc])
+
+
+def hsv_to_rgb_batch(hsv: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of HSV (0-1) values to an (N, 3) RGB (0-255) array.
+
+    Vectorized hsv_to_rgb() with colorsys's arithmetic, so rows match it exactly.
+    """
+    h, s, v = np.asarray(hsv, dtype=float).reshape(-1, 3).T
+    sector = np.trunc(h * 6.0)
+    f = (h * 6.0) - sector
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    sector = sector.astype(int)[:, None] % 6
+    # (R, G, B) for each of the six hue sectors, in colorsys order
+    sectors = [(v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q)]
+    rgb = np.select(
+        [sector == i for i in range(6)], [np.column_stack(c) for c in sectors]
+    )
+    rgb = np.where((s == 0.0)[:, None], v[:, None], rgb)
+    return np.trunc(rgb * 255).astype(int)
+
+
+@lru_cache(maxsize=8192)
 def lch_to_hex(lightness: float, chroma: float, hue: float) -> str:
-    """Convert LCH to hex color."""
+    """Convert LCH to hex color (memoized, since the conversion is pure)."""
 
-    # Convert LCH to sRGB
     try:
-        rgb = colorspacious.cspace_convert([lightness, chroma, hue], "CIELCh", "sRGB1")
-        # Clamp RGB values to valid range
-        rgb = [max(0, min(1, component)) for component in rgb]
-        return rgb_to_hex(tuple(int(c * 255) for c in rgb))
+        return lch_to_hex_batch([float(lightness)], [float(chroma)], [float(hue)])[0]
     except (ValueError, TypeError, OverflowError):
-        # Fallback for out-of-gamut colors or invalid inputs
+        # Fallback for invalid inputs
         return "#808080"  # Gray fallback
 
 
-def rgb_to_lch(rgb: Tuple[int, int, int]) -> List[float]:
-    """Convert RGB (0-255) to LCH."""
+def lch_to_hex_batch(
+    lightness: Sequence[float], chroma: Sequence[float], hue: Sequence[float]
+) -> List[str]:
+    """
+    Convert arrays of LCH values to hex colors in one vectorized pass.
+
+    Runs the LCH -> Lab -> XYZ -> sRGB pipeline on whole arrays; lch_to_hex()
+    is the single-color case. Non-finite inputs map to the gray fallback.
+
+    Args:
+        lightness: L* values (0-100)
+        chroma: C* values (0+)
+        hue: h° values (0-360)
+
+    Returns:
+        List of hex color strings
+    """
+    lch = np.stack(np.broadcast_arrays(lightness, chroma, hue), axis=-1).astype(float)
+    lch = lch.reshape(-1, 3)
+    valid = np.isfinite(lch).all(axis=1)
+    rgb = _lch_to_srgb1(np.where(valid[:, None], lch, 0.0))
+    # Clamp like max(0, min(1, c)), which also sends overflow NaNs to 1
+    rgb = np.where(rgb < 1, rgb, 1.0)
+    rgb = np.where(rgb > 0, rgb, 0.0)
+    # Round to the nearest 8-bit level; truncating would send values a few ulps
+    # short of a level (most round trips from hex) to the level below
+    hexes = rgb_to_hex_batch(np.rint(rgb * 255))
+    return [
+        hex_color if ok else "#808080" for hex_color, ok in zip(hexes, valid.tolist())
+    ]
+
+
+def _lch_to_srgb1(lch: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) CIELCh array to unclamped sRGB1 (0-1) values."""
+    lightness, chroma, hue = lch[:, 0], lch[:, 1], lch[:, 2]
+
+    # Extreme inputs overflow to inf/NaN, which callers treat as out of gamut
+    with np.errstate(over="ignore", invalid="ignore"):
+        # LCh -> Lab
+        hue_rad = np.deg2rad(hue)
+        a = chroma * np.cos(hue_rad)
+        b = chroma * np.sin(hue_rad)
+
+        # Lab -> XYZ100 (D65)
+        l_piece = 1.0 / 116 * (lightness + 16)
+        f = np.stack(
+            [l_piece + 1.0 / 500 * a, l_piece, l_piece - 1.0 / 200 * b], axis=-1
+        )
+        xyz100 = _D65_XYZ100 * np.where(
+            f <= 6.0 / 29, 3 * (6.0 / 29) ** 2 * (f - 4.0 / 29), f**3
+        )
+
+        # XYZ100 -> linear sRGB -> gamma-encoded sRGB
+        linear = np.einsum("ij,nj->ni", _XYZ100_TO_SRGB1_MATRIX, xyz100 / 100)
+        return np.where(
+            linear <= 0.0031308,
+            linear * 12.92,
+            1.055 * np.maximum(linear, 0.0031308) ** (1 / 2.4) - 0.055,
+        )
+
+
+def _srgb1_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Undo the sRGB gamma encoding of 0-1 values, as colorspacious does."""
+    return np.where(
+        rgb < 0.04045,
+        rgb / 12.92,
+        ((np.maximum(rgb, 0.04045) + 0.055) / (0.055 + 1)) ** 2.4,
+    )
+
+
+# Linear sRGB value of every 8-bit channel level, so integer RGB input needs
+# a table lookup instead of a pow() per channel
+_SRGB255_TO_LINEAR = _srgb1_to_linear(np.arange(256) / 255.0)
+
+
+def _srgb1_to_lch(rgb: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) sRGB1 (0-1) array to CIELCh, as colorspacious does."""
+    return _linear_srgb_to_lch(_srgb1_to_linear(rgb))
+
+
+def _srgb255_to_lch(rgb: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) array of integer RGB (0-255) values to CIELCh."""
+    return _linear_srgb_to_lch(_SRGB255_TO_LINEAR[rgb])
+
+
+def _linear_srgb_to_lch(linear: np.ndarray) -> np.ndarray:
+    """Convert an (N, 3) linear sRGB array to CIELCh."""
+    # Linear sRGB -> XYZ100 -> CIELab (D65)
+    xyz100 = np.einsum("ij,nj->ni", _SRGB1_TO_XYZ100_MATRIX, linear) * 100
+    t = xyz100 / _D65_XYZ100
+    f = np.where(
+        t < (6.0 / 29) ** 3,
+        (1.0 / 3) * (29.0 / 6) ** 2 * t + 4.0 / 29,
+        np.maximum(t, 0) ** (1.0 / 3),
+    )
+    lightness = 116 * f[:, 1] - 16
+    a = 500 * (f[:, 0] - f[:, 1])
+    b = 200 * (f[:, 1] - f[:, 2])
+
+    # CIELab -> CIELCh
+    hue = np.rad2deg(np.arctan2(b, a)) % 360
+    return np.column_stack([lightness, np.hypot(a, b), hue])
+
+
+def _lch_in_gamut_mask(lch: np.ndarray) -> np.ndarray:
+    """Vectorized is_lch_in_gamut() for an (N, 3) CIELCh array."""
+    lightness, chroma = lch[:, 0], lch[:, 1]
+    rgb = _lch_to_srgb1(lch)
+    in_gamut = ((rgb >= 0) & (rgb <= 1)).all(axis=1)
+    # Same black/white special case as is_lch_in_gamut()
+    return in_gamut | ((chroma == 0) & ((lightness == 0) | (lightness == 100)))
+
+
+def rgb_to_lch(rgb: Tuple[int, int, int]) -> np.ndarray:
+    """Convert RGB (0-255) to a fixed-shape [L, C, h] array."""
+    # Conversions are memoized; each caller gets its own copy of the result
+    return np.array(_rgb_to_lch_cached(tuple(rgb)))
+
+
+def rgb_to_lch_batch(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert an (N, 3) array of RGB (0-255) values to an (N, 3) LCH array.
+
+    Converts the whole array in one vectorized pass, giving the same values
+    as calling rgb_to_lch() on each row.
+    """
+    rgb = np.asarray(rgb).reshape(-1, 3)
+    if rgb.dtype.kind in "iu" and ((rgb >= 0) & (rgb <= 255)).all():
+        return _srgb255_to_lch(rgb)
+    # Float input can't raise here: non-finite values propagate as NaN/inf,
+    # exactly as they do through rgb_to_lch()
+    return _srgb1_to_lch(rgb.astype(float) / 255.0)
+
+
+def hex_to_lch_batch(hex_colors: Sequence[str]) -> np.ndarray:
+    """
+    Convert hex colors to an (N, 3) LCH array in one vectorized pass.
+
+    Equivalent to rgb_to_lch(hex_to_rgb(color)) for each color; raises
+    ValueError on the first invalid color.
+    """
+    return rgb_to_lch_batch(hex_to_rgb_batch(hex_colors))
+
+
+@lru_cache(maxsize=4096)
+def _hex_to_lch_cached(hex_color: str) -> Tuple[float, float, float]:
+    """Cached hex -> LCH, so one hex string costs at most one conversion."""
+    return _rgb_to_lch_cached(hex_to_rgb(hex_color))
 
+
+@lru_cache(maxsize=4096)
+def _rgb_to_lch_cached(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
+    """Cached implementation of rgb_to_lch()."""
+    if all(isinstance(c, int) and 0 <= c <= 255 for c in rgb):
+        return tuple(_srgb255_to_lch(np.array([rgb]))[0])
     # Normalize RGB to 0-1 range
     rgb_norm = [c / 255.0 for c in rgb]
     try:
-        return colorspacious.cspace_convert(rgb_norm, "sRGB1", "CIELCh")
+        return tuple(_srgb1_to_lch(np.array([rgb_norm]))[0])
     except (ValueError, TypeError, OverflowError):
-        return [50, 0, 0]  # Fallback to neutral gray
+        return (50.0, 0.0, 0.0)  # Fallback to neutral gray
 
 
 def calculate_delta_e(color1_hex: str, color2_hex: str) -> Optional[float]:
@@ -93,57 +383,148 @@ def calculate_delta_e(color1_hex: str, color2_hex: str) -> Optional[float]:
     """
 
     try:
-        rgb1 = [c / 255.0 for c in hex_to_rgb(color1_hex)]
-        rgb2 = [c / 255.0 for c in hex_to_rgb(color2_hex)]
-
-        lab1 = colorspacious.cspace_convert(rgb1, "sRGB1", "CIELab")
-        lab2 = colorspacious.cspace_convert(rgb2, "sRGB1", "CIELab")
+        ucs1 = np.array(_hex_to_cam02ucs_cached(color1_hex))
+        ucs2 = np.array(_hex_to_cam02ucs_cached(color2_hex))
 
-        # Calculate Delta E CIE 2000 (most accurate)
-        delta_e = colorspacious.deltaE(lab1, lab2, input_space="CIELab")
+        # Euclidean distance in CAM02-UCS, as colorspacious.deltaE() computes it
+        delta_e = np.sqrt(np.sum((ucs1 - ucs2) ** 2, axis=-1))
         return delta_e
     except (ValueError, TypeError, OverflowError):
         return None
 
 
-def get_color_info(hex_color: str) -> dict:
+@lru_cache(maxsize=4096)
+def _hex_to_cam02ucs_cached(hex_color: str) -> Tuple[float, float, float]:
+    """
+    Cached hex -> CIELab -> CAM02-UCS conversion used by calculate_delta_e().
+
+    Goes through CIELab like the original deltaE(lab1, lab2) call did, so each
+    color is converted once no matter how many colors it is compared with.
+    """
+    rgb = [c / 255.0 for c in hex_to_rgb(hex_color)]
+    lab = colorspacious.cspace_convert(rgb, "sRGB1", "CIELab")
+    return tuple(colorspacious.cspace_convert(lab, "CIELab", "CAM02-UCS"))
+
+
+def calculate_delta_e_batch(
+    colors1: Union[str, Sequence[str]], colors2: Union[str, Sequence[str]]
+) -> np.ndarray:
+    """
+    Calculate Delta E between two sets of hex colors in one vectorized pass.
+
+    Colors are compared pairwise; passing a single hex string for either
+    argument compares it against every color in the other (one-vs-many), so
+    the reference color is only parsed and converted once. Uses the same
+    metric as calculate_delta_e(), but invalid colors give NaN instead of None.
+
+    Returns:
+        Array of Delta E values
+    """
+    rgb1, rgb2 = np.broadcast_arrays(
+        _hex_to_srgb1_array(colors1), _hex_to_srgb1_array(colors2)
+    )
+    valid = np.isfinite(rgb1).all(axis=-1) & np.isfinite(rgb2).all(axis=-1)
+    # colorspacious cannot handle NaN, so convert a placeholder and mask it out
+    lab1 = colorspacious.cspace_convert(
+        np.where(valid[..., None], rgb1, 0.0), "sRGB1", "CIELab"
+    )
+    lab2 = colorspacious.cspace_convert(
+        np.where(valid[..., None], rgb2, 0.0), "sRGB1", "CIELab"
+    )
+    delta_e = colorspacious.deltaE(lab1, lab2, input_space="CIELab")
+    return np.where(valid, delta_e, np.nan)
+
+
+def calculate_delta_e_matrix(colors: Sequence[str]) -> np.ndarray:
+    """
+    Calculate Delta E between every pair of hex colors.
+
+    Each color is converted to CAM02-UCS once and the (N, N) distance matrix
+    is computed by broadcasting. Uses the same metric as calculate_delta_e();
+    rows and columns of invalid colors are NaN.
+
+    Returns:
+        Symmetric (N, N) array of Delta E values with a zero diagonal
+    """
+    rgb = _hex_to_srgb1_array(list(colors)).reshape(-1, 3)
+    valid = np.isfinite(rgb).all(axis=-1)
+    # colorspacious cannot handle NaN, so convert a placeholder and mask it out
+    lab = colorspacious.cspace_convert(
+        np.where(valid[:, None], rgb, 0.0), "sRGB1", "CIELab"
+    )
+    ucs = colorspacious.cspace_convert(lab, "CIELab", "CAM02-UCS")
+    delta_e = np.sqrt(np.sum((ucs[:, None, :] - ucs[None, :, :]) ** 2, axis=-1))
+    return np.where(valid[:, None] & valid[None, :], delta_e, np.nan)
+
+
+def _hex_to_srgb1_array(colors: Union[str, Sequence[str]]) -> np.ndarray:
+    """Parse hex colors into sRGB1 (0-1) rows, with NaN rows for invalid input."""
+    if isinstance(colors, str):
+        return _hex_to_srgb1_array([colors])[0]
+
+    rgb, valid = _parse_hex_array(colors)
+    return np.where(valid[:, None], rgb / 255.0, np.nan)
+
+
+@dataclass(frozen=True, slots=True)
+class ColorInfo:
+    """RGB, HSV and LCH representations of a single hex color."""
+
+    hex: str
+    rgb: Tuple[int, int, int]
+    hsv: Tuple[float, float, float]
+    lch: Optional[Tuple[float, float, float]] = None
+
+    @property
+    def hsv_degrees(self) -> Tuple[float, float, float]:
+        return (self.hsv[0] * 360, self.hsv[1], self.hsv[2])
+
+    @property
+    def lch_lightness(self) -> Optional[float]:
+        return None if self.lch is None else self.lch[0]
+
+    @property
+    def lch_chroma(self) -> Optional[float]:
+        return None if self.lch is None else self.lch[1]
+
+    @property
+    def lch_hue(self) -> Optional[float]:
+        return None if self.lch is None else self.lch[2]
+
+    def as_dict(self) -> dict:
+        """Return the color information as the dict get_color_info() used to."""
+        return {
+            "hex": self.hex,
+            "rgb": self.rgb,
+            "hsv": self.hsv,
+            "hsv_degrees": self.hsv_degrees,
+            "lch": self.lch,
+            "lch_lightness": self.lch_lightness,
+            "lch_chroma": self.lch_chroma,
+            "lch_hue": self.lch_hue,
+        }
+
+
+@lru_cache(maxsize=4096)
+def get_color_info(hex_color: str) -> ColorInfo:
     """
     Get color information for a hex color.
 
+    ColorInfo is immutable, so the result is memoized and shared between
+    callers asking about the same hex string.
+
     Returns:
-        dict: Color information including RGB, HSV, and LCH values
+        ColorInfo: Color information including RGB, HSV, and LCH values
     """
     rgb = hex_to_rgb(hex_color)
     hsv = rgb_to_hsv(rgb)
 
-    info = {
-        "hex": hex_color,
-        "rgb": rgb,
-        "hsv": hsv,
-        "hsv_degrees": (hsv[0] * 360, hsv[1], hsv[2]),
-    }
-
     try:
-        lightness, chroma, hue_lch = rgb_to_lch(rgb)
-        info.update(
-            {
-                "lch": (lightness, chroma, hue_lch),
-                "lch_lightness": lightness,
-                "lch_chroma": chroma,
-                "lch_hue": hue_lch,
-            }
-        )
+        lch = _hex_to_lch_cached(hex_color)
     except (ValueError, TypeError, OverflowError):
-        info.update(
-            {
-                "lch": None,
-                "lch_lightness": None,
-                "lch_chroma": None,
-                "lch_hue": None,
-            }
-        )
+        lch = None
 
-    return info
+    return ColorInfo(hex=hex_color, rgb=rgb, hsv=hsv, lch=lch)
 
 
 def is_color_dark(hex_color: str, threshold: float = 35.0) -> bool:
@@ -176,21 +557,41 @@ def is_color_dark(hex_color: str, threshold: float = 35.0) -> bool:
         >>> is_color_dark("#FF0000", threshold=50.0)  # Custom threshold
         True
     """
+    rgb = hex_to_rgb(hex_color)  # This will raise ValueError for invalid hex
     try:
-        rgb = hex_to_rgb(hex_color)
-        lightness, _, _ = rgb_to_lch(rgb)
+        lightness, _, _ = _hex_to_lch_cached(hex_color)
         return bool(lightness < threshold)
     except (ValueError, TypeError, OverflowError):
         # Fallback: if LCh conversion fails, use RGB luminance approximation
-        rgb = hex_to_rgb(hex_color)  # This will raise ValueError for invalid hex
         # Calculate relative luminance (ITU-R BT.709)
-        r, g, b = [c / 255.0 for c in rgb]
+        r, g, b = rgb[0] / 255.0, rgb[1] / 255.0, rgb[2] / 255.0
         luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
         # Convert to approximate LCh lightness scale (0-100)
         approx_lightness = luminance * 100
         return bool(approx_lightness < threshold)
 
 
+def is_color_dark_batch(
+    hex_colors: Sequence[str], threshold: float = 35.0
+) -> np.ndarray:
+    """
+    Vectorized is_color_dark() for many colors at once.
+
+    Args:
+        hex_colors: Hex color strings
+        threshold (float): Lightness threshold (0-100). Colors below this are dark.
+
+    Returns:
+        np.ndarray: Boolean array, True where the color is dark
+
+    Raises:
+        ValueError: If any hex color is invalid
+    """
+    lightness = hex_to_lch_batch(hex_colors)[:, 0]
+    return lightness < threshold
+
+
+@lru_cache(maxsize=4096)
 def is_lch_in_gamut(lightness: float, chroma: float, hue: float) -> bool:
     """
     Determines if an LCH color is within the sRGB gamut.
@@ -208,18 +609,22 @@ def is_lch_in_gamut(lightness: float, chroma: float, hue: float) -> bool:
         return True
 
     try:
-        rgb = colorspacious.cspace_convert([lightness, chroma, hue], "CIELCh", "sRGB1")
-        return all(0 <= component <= 1 for component in rgb)
+        lch = np.array([[float(lightness), float(chroma), float(hue)]])
+        return bool(_lch_in_gamut_mask(lch)[0])
     except (ValueError, TypeError, OverflowError):
         return False
 
 
+@lru_cache(maxsize=4096)
 def find_max_in_gamut_chroma(
     lightness: float, hue: float, precision: float = 0.5
 ) -> float:
     """
     Finds the maximum chroma value that keeps the color within sRGB gamut.
 
+    Results are memoized: palette generation keeps asking for the same
+    lightness/hue pairs, and each search costs a dozen gamut checks.
+
     Args:
         lightness: L* value (0-100)
         hue: h° value (0-360)
@@ -228,18 +633,28 @@ def find_max_in_gamut_chroma(
     Returns:
         float: Maximum chroma value that keeps the color in gamut
     """
+    # The boundary is solved in closed form; the search below only replays
+    # the usual bisection steps against it so results stay on the same grid
+    boundary = _max_in_gamut_chroma_closed_form(lightness, hue)
+
+    def in_gamut(chroma: float) -> bool:
+        # Colors right at the boundary get a real conversion to settle rounding
+        if boundary is None or abs(chroma - boundary) < 1e-6:
+            return is_lch_in_gamut(lightness, chroma, hue)
+        return chroma < boundary
+
     low = 0
     high = 150  # Reasonable starting maximum
 
     # If maximum is in gamut, increase until we find the limit
-    if is_lch_in_gamut(lightness, high, hue):
-        while is_lch_in_gamut(lightness, high, hue):
+    if in_gamut(high):
+        while in_gamut(high):
             high *= 2
 
     # Binary search for the maximum value
     while high - low > precision:
         mid = (low + high) / 2
-        if is_lch_in_gamut(lightness, mid, hue):
+        if in_gamut(mid):
             low = mid
         else:
             high = mid
@@ -247,6 +662,96 @@ def find_max_in_gamut_chroma(
     return low
 
 
+def _max_in_gamut_chroma_closed_form(lightness: float, hue: float) -> Optional[float]:
+    """
+    Solve for the chroma at which an (L*, h°) ray leaves the sRGB gamut.
+
+    With lightness and hue fixed, Y is constant while X and Z are piecewise
+    cubic in C*, so every linear-sRGB channel is a piecewise cubic polynomial
+    in C*. The boundary is the smallest positive root of channel == 0 or
+    channel == 1 over all three channels.
+
+    Returns:
+        float or None: Boundary chroma, or None where the closed form does not
+        apply (gray axis outside the gamut, near-degenerate polynomials)
+    """
+    if not (math.isfinite(lightness) and math.isfinite(hue)):
+        return None
+
+    l_piece = (lightness + 16) / 116
+    hue_rad = math.radians(hue)
+    slopes = np.array([math.cos(hue_rad) / 500, 0.0, -math.sin(hue_rad) / 200])
+    # f_j(C) = l_piece + slopes[j] * C; breakpoints where f_j crosses delta
+    breakpoints = sorted(
+        (_LAB_DELTA - l_piece) / slope
+        for slope in slopes.tolist()
+        if slope != 0 and (_LAB_DELTA - l_piece) / slope > 0
+    )
+    edges = [0.0, *breakpoints, math.inf]
+    # Coefficients are expressed in u = C / 100 to keep them well scaled
+    slopes = slopes * 100
+    powers = np.arange(4)
+
+    for low, high in zip(edges[:-1], edges[1:]):
+        probe = low + 1 if math.isinf(high) else (low + high) / 2
+        cubic = l_piece + slopes * probe / 100 > _LAB_DELTA
+        # Ascending coefficients of f_j^-1 (XYZ / white point) per component
+        f_inv = np.where(
+            cubic[:, None],
+            np.stack(
+                [
+                    np.full(3, l_piece**3),
+                    3 * l_piece**2 * slopes,
+                    3 * l_piece * slopes**2,
+                    slopes**3,
+                ],
+                axis=1,
+            ),
+            3
+            * _LAB_DELTA**2
+            * np.stack(
+                [np.full(3, l_piece - 4.0 / 29), slopes, np.zeros(3), np.zeros(3)],
+                axis=1,
+            ),
+        )
+        xyz = f_inv * _D65_XYZ100[:, None] / 100
+        linear = _XYZ100_TO_SRGB1_MATRIX @ xyz
+        gray = linear[:, 0]
+        if low == 0 and not ((gray > 1e-12) & (gray < 1 - 1e-12)).all():
+            return None
+
+        # Channel polynomials for both gamut walls: linear == 0 and linear == 1
+        polys = np.concatenate([linear, linear - [1, 0, 0, 0]])
+        scale = np.abs(_XYZ100_TO_SRGB1_MATRIX) @ np.abs(xyz[:, 3])
+        leading = polys[:, 3]
+        if (scale > 0).any():
+            if (np.abs(leading) <= 1e-6 * np.tile(scale, 2)).any():
+                return None
+            companion = np.zeros((6, 3, 3))
+            companion[:, 1, 0] = companion[:, 2, 1] = 1
+            companion[:, :, 2] = -polys[:, :3] / leading[:, None]
+            roots = np.linalg.eigvals(companion)
+            real = np.abs(roots.imag) <= 1e-9 * (1 + np.abs(roots.real))
+            # One Newton step against the original polynomials to polish them
+            u = roots.real[..., None]
+            value = (polys[:, None, :] * u**powers).sum(axis=-1)
+            slope = (polys[:, None, 1:] * powers[1:] * u ** powers[:-1]).sum(axis=-1)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                roots = np.where(slope != 0, u[..., 0] - value / slope, u[..., 0])
+            roots = roots[real]
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                roots = -polys[:, 0] / polys[:, 1]
+        roots = roots * 100
+        roots = roots[
+            np.isfinite(roots) & (roots > low - 1e-9) & (roots <= high + 1e-9)
+        ]
+        if roots.size:
+            return float(roots.min())
+
+    return None
+
+
 def adjust_lch_to_gamut(
     lightness: float, chroma: float, hue: float, preserve: str = "lightness"
 ) -> Tuple[float, float, float]:
@@ -270,12 +775,14 @@ def adjust_lch_to_gamut(
         return (lightness, find_max_in_gamut_chroma(lightness, hue), hue)
     elif preserve == "chroma":
         # Adjust lightness (simplified implementation)
-        # Look for nearby L that allows the given chroma
-        for l_offset in range(1, 50):
-            for direction in [1, -1]:
-                new_l = lightness + l_offset * direction
-                if 0 <= new_l <= 100 and is_lch_in_gamut(new_l, chroma, hue):
-                    return (new_l, chroma, hue)
+        # Look for the nearest L that allows the given chroma, trying +1, -1,
+        # +2, -2, ... in order; the whole sweep is gamut-checked in one batch
+        test_l = lightness + _NEAREST_LIGHTNESS_OFFSETS
+        test_l = test_l[(test_l >= 0) & (test_l <= 100)]
+        test_lch = np.column_stack(np.broadcast_arrays(test_l, chroma, hue))
+        in_gamut = np.flatnonzero(_lch_in_gamut_mask(test_lch))
+        if in_gamut.size:
+            return (test_l[in_gamut[0]].item(), chroma, hue)
         # If we can't find one, fall back to preserving lightness
         return (lightness, find_max_in_gamut_chroma(lightness, hue), hue)
     else:  # "both" - try to adjust both minimally
@@ -287,6 +794,9 @@ def calculate_std_dev(values: List[float]) -> float:
     """Calculate standard deviation of a list of values."""
     if not values:
         return 0
+    if len(values) >= 128:
+        # NumPy's setup cost only pays off once the list gets long
+        return float(np.std(values))
     mean = sum(values) / len(values)
     variance = sum((x - mean) ** 2 for x in values) / len(values)
     return variance**0.5
@@ -316,8 +826,11 @@ def contrast_ratio(hex1: str, hex2: str) -> float:
 
     Returns value >= 1.0 (lighter/darker).
     """
-    l1 = relative_luminance(hex1)
-    l2 = relative_luminance(hex2)
+    return _luminance_contrast_ratio(relative_luminance(hex1), relative_luminance(hex2))
+
+
+def _luminance_contrast_ratio(l1: float, l2: float) -> float:
+    """WCAG contrast ratio from two precomputed relative luminances."""
     lighter = max(l1, l2)
     darker = min(l1, l2)
     return (lighter + 0.05) / (darker + 0.05)
@@ -347,25 +860,32 @@ def adjust_for_contrast(
     Returns None if not achievable in gamut.
     Ratios are rounded to 1 decimal before comparison to avoid float precision issues.
     """
-    rgb = hex_to_rgb(fg_hex)
-    lightness, chroma, hue = rgb_to_lch(rgb)
     min_ratio = float(min_ratio)
-    if round(contrast_ratio(fg_hex, bg_hex), 1) >= min_ratio:
+    # The background is fixed for the whole search, so its luminance is too
+    bg_luminance = relative_luminance(bg_hex)
+    if (
+        round(_luminance_contrast_ratio(relative_luminance(fg_hex), bg_luminance), 1)
+        >= min_ratio
+    ):
         return fg_hex
 
-    candidates = []
-    for test_l in range(0, 101, 2):
-        if not is_lch_in_gamut(test_l, chroma, hue):
-            continue
-        adjusted = lch_to_hex(test_l, chroma, hue)
-        if round(contrast_ratio(adjusted, bg_hex), 1) >= min_ratio:
-            candidates.append((test_l, adjusted))
-
-    if not candidates:
+    lightness, chroma, hue = _hex_to_lch_cached(fg_hex)
+    # Hue and chroma are fixed, so gamut-check and convert every candidate
+    # lightness in one batch instead of once per loop iteration
+    test_lch = np.column_stack(
+        np.broadcast_arrays(np.arange(0, 101, 2, dtype=float), chroma, hue)
+    )
+    test_lch = test_lch[_lch_in_gamut_mask(test_lch)]
+    test_hexes = lch_to_hex_batch(test_lch[:, 0], chroma, hue)
+
+    ratios = [
+        _luminance_contrast_ratio(relative_luminance(adjusted), bg_luminance)
+        for adjusted in test_hexes
+    ]
+    passing = np.flatnonzero([round(ratio, 1) >= min_ratio for ratio in ratios])
+    if not passing.size:
         return None
 
-    def dist_to_original(light: float) -> float:
-        return abs(light - lightness)
-
-    best_l, best_hex = min(candidates, key=lambda x: dist_to_original(x[0]))
-    return best_hex
+    # Pick the passing candidate closest to the original lightness by index
+    best = passing[np.argmin(np.abs(test_lch[passing, 0] - lightness))]
+    return test_hexes[best]
@@ -5,9 +5,14 @@ This module provides functions for analyzing color interpolation results,
 including perceptual metrics and quality assessment.
 """
 
+import math
 from typing import List
 
-from themeweaver.color_utils import calculate_delta_e, get_color_info
+from themeweaver.color_utils import (
+    calculate_delta_e_batch,
+    calculate_std_dev,
+    get_color_info,
+)
 
 
 def analyze_interpolation(colors: List[str], method: str = "unknown") -> None:
@@ -46,12 +51,12 @@ def analyze_interpolation(colors: List[str], method: str = "unknown") -> None:
 
     for i, color in enumerate(colors):
         info = get_color_info(color)
-        hsv_deg = info["hsv_degrees"]
+        hsv_deg = info.hsv_degrees
 
         analysis_str = f"Step {i + 1:2d}: {color} | HSV({hsv_deg[0]:6.1f}°, {hsv_deg[1]:.2f}, {hsv_deg[2]:.2f})"
 
-        if info.get("lch"):
-            lch = info["lch"]
+        if info.lch:
+            lch = info.lch
             analysis_str += f" | LCH({lch[0]:.1f}, {lch[1]:.1f}, {lch[2]:.1f}°)"
 
         print(analysis_str)
@@ -61,9 +66,9 @@ def analyze_interpolation(colors: List[str], method: str = "unknown") -> None:
         print("\n=== Perceptual Distance Analysis ===")
 
         delta_es = []
-        for i in range(len(colors) - 1):
-            delta_e = calculate_delta_e(colors[i], colors[i + 1])
-            if delta_e is not None:
+        steps = calculate_delta_e_batch(colors[:-1], colors[1:]).tolist()
+        for i, delta_e in enumerate(steps):
+            if not math.isnan(delta_e):
                 delta_es.append(delta_e)
                 print(f"Step {i + 1} → {i + 2}: ΔE = {delta_e:.1f}")
 
@@ -71,10 +76,7 @@ def analyze_interpolation(colors: List[str], method: str = "unknown") -> None:
             avg_delta_e = sum(delta_es) / len(delta_es)
             min_delta_e = min(delta_es)
             max_delta_e = max(delta_es)
-
-            # Calculate standard deviation
-            variance = sum((x - avg_delta_e) ** 2 for x in delta_es) / len(delta_es)
-            std_dev = variance**0.5
+            std_dev = calculate_std_dev(delta_es)
 
             print("\nPerceptual Statistics:")
             print(f"  Average ΔE: {avg_delta_e:.1f}")
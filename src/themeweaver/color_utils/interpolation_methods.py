@@ -7,6 +7,9 @@ mathematical applications.
 """
 
 import math
+from functools import lru_cache, partial
+
+import numpy as np
 
 
 def linear_interpolate(start, end, factor):
@@ -156,6 +159,41 @@ def quintic_interpolate(start, end, factor):
     return start + (end - start) * smooth_factor
 
 
+# Easing curves for the RGB-based methods of interpolate_colors()
+_RGB_EASINGS = {
+    "linear": linear_interpolate,
+    "cubic": cubic_interpolate,
+    "exponential": exponential_interpolate,
+    "sine": sine_interpolate,
+    "cosine": cosine_interpolate,
+    "hermite": hermite_interpolate,
+    "quintic": quintic_interpolate,
+}
+
+
+def _step_factors(steps):
+    """Interpolation factors i / (steps - 1) for every step, as an array."""
+    return np.arange(steps) / (steps - 1) if steps > 1 else np.zeros(max(steps, 0))
+
+
+@lru_cache(maxsize=64)
+def _eased_factors(method, steps, exponent, start, end):
+    """
+    Evaluate an RGB easing curve between start and end at every step.
+
+    The curve only depends on the method and step count, so ramps with
+    different endpoint colors share it. The curves stay on the scalar
+    functions: NumPy's power can be an ulp off Python's, which shifts
+    truncated channels. The returned array is read-only.
+    """
+    easing = _RGB_EASINGS[method]
+    if method == "exponential":
+        easing = partial(easing, exponent=exponent)
+    eased = np.array([easing(start, end, f) for f in _step_factors(steps).tolist()])
+    eased.flags.writeable = False
+    return eased
+
+
 def interpolate_colors(start_hex, end_hex, steps, method="linear", exponent=2):
     """
     Interpolate between two hex colors using various methods and color spaces.
@@ -184,92 +222,81 @@ def interpolate_colors(start_hex, end_hex, steps, method="linear", exponent=2):
     Returns:
         List of hex color strings with interpolated colors
     """
+    from themeweaver.color_utils import hex_to_rgb
+
+    # Ramps are deterministic in their arguments; keying the cache on parsed
+    # RGB lets '#ff0000' and 'FF0000' share an entry. Hand out a fresh list so
+    # callers can't mutate the cached ramp
+    return list(
+        _interpolate_colors_cached(
+            hex_to_rgb(start_hex), hex_to_rgb(end_hex), steps, method, exponent
+        )
+    )
+
+
+@lru_cache(maxsize=256)
+def _interpolate_colors_cached(start_rgb, end_rgb, steps, method, exponent):
+    """Cached implementation of interpolate_colors()."""
     from themeweaver.color_utils import (
-        hex_to_rgb,
-        hsv_to_rgb,
-        lch_to_hex,
-        rgb_to_hex,
+        hsv_to_rgb_batch,
+        lch_to_hex_batch,
+        rgb_to_hex_batch,
         rgb_to_hsv,
         rgb_to_lch,
     )
 
-    start_rgb = hex_to_rgb(start_hex)
-    end_rgb = hex_to_rgb(end_hex)
-
-    colors = []
-
     if method == "hsv":
         # Convert to HSV for more natural color transitions
         start_hsv = rgb_to_hsv(start_rgb)
         end_hsv = rgb_to_hsv(end_rgb)
 
-        for i in range(steps):
-            factor = i / (steps - 1) if steps > 1 else 0
+        # Interpolate in HSV space with proper hue wrapping
+        factors = _step_factors(steps)
+        h = circular_interpolate(start_hsv[0] * 360, end_hsv[0] * 360, factors) / 360
+        s = linear_interpolate(start_hsv[1], end_hsv[1], factors)
+        v = linear_interpolate(start_hsv[2], end_hsv[2], factors)
 
-            # Interpolate in HSV space with proper hue wrapping
-            h = circular_interpolate(start_hsv[0] * 360, end_hsv[0] * 360, factor) / 360
-            s = linear_interpolate(start_hsv[1], end_hsv[1], factor)
-            v = linear_interpolate(start_hsv[2], end_hsv[2], factor)
-
-            # Convert back to RGB
-            rgb = hsv_to_rgb((h, s, v))
-            colors.append(rgb_to_hex(rgb))
+        # Convert all steps back to RGB at once
+        colors = rgb_to_hex_batch(hsv_to_rgb_batch(np.column_stack((h, s, v))))
 
     elif method == "lch":
         # Convert to LCH for perceptually uniform interpolation
         start_lch = rgb_to_lch(start_rgb)
         end_lch = rgb_to_lch(end_rgb)
 
-        for i in range(steps):
-            factor = i / (steps - 1) if steps > 1 else 0
-
-            # Interpolate in LCH space with proper hue wrapping
-            lightness = linear_interpolate(start_lch[0], end_lch[0], factor)
-            chroma = linear_interpolate(start_lch[1], end_lch[1], factor)
-            hue = circular_interpolate(start_lch[2], end_lch[2], factor)
-
-            # Convert back to hex
-            colors.append(lch_to_hex(lightness, chroma, hue))
+        # Interpolate in LCH space with proper hue wrapping
+        factors = _step_factors(steps)
+        lightness = linear_interpolate(start_lch[0], end_lch[0], factors)
+        chroma = linear_interpolate(start_lch[1], end_lch[1], factors)
+        hue = circular_interpolate(start_lch[2], end_lch[2], factors)
+
+        # Convert back to hex
+        colors = lch_to_hex_batch(lightness, chroma, hue)
+
+    elif method in _RGB_EASINGS:
+        # RGB-based methods, broadcast over the (steps, 3) grid
+        start = np.asarray(start_rgb, dtype=float)
+        end = np.asarray(end_rgb, dtype=float)
+        if method != "exponential":
+            # Only the exponential curve depends on the exponent
+            exponent = None
+        if method == "hermite":
+            # Hermite blends the two endpoints instead of scaling their delta
+            start_weights = _eased_factors(method, steps, exponent, 1.0, 0.0)
+            end_weights = _eased_factors(method, steps, exponent, 0.0, 1.0)
+            rgb = (
+                start_weights[:, np.newaxis] * start + end_weights[:, np.newaxis] * end
+            )
+        else:
+            eased = _eased_factors(method, steps, exponent, 0.0, 1.0)
+            rgb = linear_interpolate(start, end, eased[:, np.newaxis])
+
+        colors = rgb_to_hex_batch(rgb.astype(int))
 
     else:
-        # RGB-based methods
-        for i in range(steps):
-            factor = i / (steps - 1) if steps > 1 else 0
-
-            if method == "linear":
-                r = linear_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = linear_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = linear_interpolate(start_rgb[2], end_rgb[2], factor)
-            elif method == "cubic":
-                r = cubic_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = cubic_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = cubic_interpolate(start_rgb[2], end_rgb[2], factor)
-            elif method == "exponential":
-                r = exponential_interpolate(start_rgb[0], end_rgb[0], factor, exponent)
-                g = exponential_interpolate(start_rgb[1], end_rgb[1], factor, exponent)
-                b = exponential_interpolate(start_rgb[2], end_rgb[2], factor, exponent)
-            elif method == "sine":
-                r = sine_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = sine_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = sine_interpolate(start_rgb[2], end_rgb[2], factor)
-            elif method == "cosine":
-                r = cosine_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = cosine_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = cosine_interpolate(start_rgb[2], end_rgb[2], factor)
-            elif method == "hermite":
-                r = hermite_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = hermite_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = hermite_interpolate(start_rgb[2], end_rgb[2], factor)
-            elif method == "quintic":
-                r = quintic_interpolate(start_rgb[0], end_rgb[0], factor)
-                g = quintic_interpolate(start_rgb[1], end_rgb[1], factor)
-                b = quintic_interpolate(start_rgb[2], end_rgb[2], factor)
-            else:
-                raise ValueError(f"Unknown interpolation method: {method}")
-
-            colors.append(rgb_to_hex((int(r), int(g), int(b))))
+        raise ValueError(f"Unknown interpolation method: {method}")
 
-    return colors
+    return tuple(colors)
 
 
 def validate_gradient_uniqueness(colors, method="unknown"):
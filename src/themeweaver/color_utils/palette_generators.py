@@ -10,9 +10,10 @@ from typing import Dict, List, Tuple, Union
 
 from themeweaver.color_utils import (
     adjust_lch_to_gamut,
+    hex_to_lch_batch,
     hex_to_rgb,
-    is_lch_in_gamut,
     lch_to_hex,
+    lch_to_hex_batch,
     rgb_to_lch,
 )
 from themeweaver.core.syntax_schema import (
@@ -107,8 +108,7 @@ def generate_lightness_gradient_from_color(color_hex: str) -> List[str]:
     lightness, chroma, hue = rgb_to_lch(rgb)
 
     # Check if in gamut and adjust if necessary
-    if not is_lch_in_gamut(lightness, chroma, hue):
-        lightness, chroma, hue = adjust_lch_to_gamut(lightness, chroma, hue)
+    lightness, chroma, hue = adjust_lch_to_gamut(lightness, chroma, hue)
 
     # Determine the natural position of the color in the gradient (0-15)
     # Map lightness (0-100) to position (0-15)
@@ -153,16 +153,14 @@ def generate_lightness_gradient_from_color(color_hex: str) -> List[str]:
         else:
             chroma_values.append(chroma)
 
-    # Generate final colors
-    colors = []
+    # Adjust if outside gamut
     for i in range(16):
-        # Check and adjust if outside gamut
-        if not is_lch_in_gamut(lightness_values[i], chroma_values[i], hue):
-            _, chroma_values[i], _ = adjust_lch_to_gamut(
-                lightness_values[i], chroma_values[i], hue
-            )
+        _, chroma_values[i], _ = adjust_lch_to_gamut(
+            lightness_values[i], chroma_values[i], hue
+        )
 
-        colors.append(lch_to_hex(lightness_values[i], chroma_values[i], hue))
+    # Generate final colors
+    colors = lch_to_hex_batch(lightness_values, chroma_values, hue)
 
     # Ensure first color is black and last is white
     colors[0] = "#000000"
@@ -223,10 +221,10 @@ def _generate_syntax_palette(
     Returns:
         dict: B10 through B170
     """
-    syntax_palette = {}
     palette_keys = syntax_palette_keys()
+    lch_values = []
 
-    for i, key in enumerate(palette_keys):
+    for i in range(len(palette_keys)):
         # Calculate hue using golden ratio for optimal distribution
         h_offset = (seed_hue + i * 360 * GOLDEN_RATIO) % 360
 
@@ -257,13 +255,11 @@ def _generate_syntax_palette(
         chroma_i = max(SYNTAX_CHROMA_RANGE[0], min(SYNTAX_CHROMA_RANGE[1], chroma_i))
 
         # Check and adjust gamut
-        if not is_lch_in_gamut(lightness_i, chroma_i, h_offset):
-            _, chroma_i, _ = adjust_lch_to_gamut(lightness_i, chroma_i, h_offset)
+        _, chroma_i, _ = adjust_lch_to_gamut(lightness_i, chroma_i, h_offset)
 
-        # Add to palette
-        syntax_palette[key] = lch_to_hex(lightness_i, chroma_i, h_offset)
+        lch_values.append((lightness_i, chroma_i, h_offset))
 
-    return syntax_palette
+    return dict(zip(palette_keys, lch_to_hex_batch(*zip(*lch_values))))
 
 
 def _generate_group_palettes(
@@ -293,13 +289,12 @@ def _generate_group_palettes(
         max(lightness + 20, GROUP_LIGHT_LIGHTNESS_RANGE[0]),
         GROUP_LIGHT_LIGHTNESS_RANGE[1],
     )
-    if not is_lch_in_gamut(light_lightness, chroma, hue):
-        _, chroma_adjusted, _ = adjust_lch_to_gamut(light_lightness, chroma, hue)
-        group_light["B10"] = lch_to_hex(light_lightness, chroma_adjusted, hue)
-    else:
-        group_light["B10"] = lch_to_hex(light_lightness, chroma, hue)
+    _, chroma_adjusted, _ = adjust_lch_to_gamut(light_lightness, chroma, hue)
+    group_light["B10"] = lch_to_hex(light_lightness, chroma_adjusted, hue)
 
     # Generate remaining colors
+    dark_lch = []
+    light_lch = []
     for i in range(1, num_colors):
         # Calculate new hue using golden ratio for optimal distribution
         h_offset = (hue + i * 360 * GOLDEN_RATIO) % 360
@@ -337,15 +332,17 @@ def _generate_group_palettes(
         )
 
         # Check and adjust gamut
-        if not is_lch_in_gamut(dark_l_i, dark_c_i, h_offset):
-            _, dark_c_i, _ = adjust_lch_to_gamut(dark_l_i, dark_c_i, h_offset)
+        _, dark_c_i, _ = adjust_lch_to_gamut(dark_l_i, dark_c_i, h_offset)
+        _, light_c_i, _ = adjust_lch_to_gamut(light_l_i, light_c_i, h_offset)
 
-        if not is_lch_in_gamut(light_l_i, light_c_i, h_offset):
-            _, light_c_i, _ = adjust_lch_to_gamut(light_l_i, light_c_i, h_offset)
+        dark_lch.append((dark_l_i, dark_c_i, h_offset))
+        light_lch.append((light_l_i, light_c_i, h_offset))
 
-        # Add to palettes
-        group_dark[f"B{(i + 1) * 10}"] = lch_to_hex(dark_l_i, dark_c_i, h_offset)
-        group_light[f"B{(i + 1) * 10}"] = lch_to_hex(light_l_i, light_c_i, h_offset)
+    # Add to palettes
+    if num_colors > 1:
+        keys = [f"B{(i + 1) * 10}" for i in range(1, num_colors)]
+        group_dark.update(zip(keys, lch_to_hex_batch(*zip(*dark_lch))))
+        group_light.update(zip(keys, lch_to_hex_batch(*zip(*light_lch))))
 
     return group_dark, group_light
 
@@ -411,16 +408,9 @@ def _analyze_group_colors(colors: List[str]) -> Dict[str, float]:
     Returns:
         dict: Analysis results with average lightness, chroma, hue distribution, etc.
     """
-    lch_values = []
-    for color in colors:
-        rgb = hex_to_rgb(color)
-        lch = rgb_to_lch(rgb)
-        lch_values.append(lch)
-
-    # Calculate averages and ranges
-    lightnesses = [lch[0] for lch in lch_values]
-    chromas = [lch[1] for lch in lch_values]
-    hues = [lch[2] for lch in lch_values]
+    # One (N, 3) array of LCH rows, split into per-channel columns
+    lch_values = hex_to_lch_batch(colors)
+    lightnesses, chromas, hues = lch_values.T.tolist()
 
     # Calculate hue distribution (handle circular nature of hue)
     hue_distribution = _calculate_hue_distribution(hues)
@@ -494,8 +484,8 @@ def _generate_syntax_from_analysis(
     Returns:
         dict: Syntax palette with B10–B170 keys
     """
-    syntax_palette = {}
     palette_keys = syntax_palette_keys()
+    lch_values = []
 
     # Base parameters from analysis
     base_lightness = analysis["avg_lightness"]
@@ -512,7 +502,7 @@ def _generate_syntax_from_analysis(
         target_lightness = max(25, base_lightness - 15)
         target_chroma = min(80, base_chroma + 5)
 
-    for i, key in enumerate(palette_keys):
+    for i in range(len(palette_keys)):
         # Cycle through dominant hues
         if dominant_hues:
             base_hue = dominant_hues[i % len(dominant_hues)]
@@ -532,11 +522,9 @@ def _generate_syntax_from_analysis(
         chroma = max(30, min(100, target_chroma + chroma_variation))
 
         # Ensure color is in gamut
-        if not is_lch_in_gamut(lightness, chroma, hue):
-            lightness, chroma, hue = adjust_lch_to_gamut(lightness, chroma, hue)
+        lightness, chroma, hue = adjust_lch_to_gamut(lightness, chroma, hue)
 
-        # Convert to hex
-        color_hex = lch_to_hex(lightness, chroma, hue)
-        syntax_palette[key] = color_hex
+        lch_values.append((lightness, chroma, hue))
 
-    return syntax_palette
+    # Convert to hex
+    return dict(zip(palette_keys, lch_to_hex_batch(*zip(*lch_values))))
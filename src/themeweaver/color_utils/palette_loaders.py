@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 
 import yaml
 
+from themeweaver.core.yaml_loader import safe_load_yaml
+
 
 def load_color_groups_from_file(
     file_path: Union[str, Path],
@@ -118,7 +120,7 @@ def load_palette_from_file(file_path: Union[str, Path]) -> Dict[str, Dict[str, s
     # Try loading as YAML
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = safe_load_yaml(f)
             if isinstance(data, dict):
                 # Try extracting a color group from nested YAML structure
                 group_name, colors = _extract_color_group_from_yaml(data)
@@ -222,7 +224,7 @@ def get_available_color_groups(file_path: Union[str, Path]) -> List[str]:
     try:
         # Try YAML first
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = safe_load_yaml(f)
             if isinstance(data, dict):
                 # Look for nested color groups
                 group_names = []
@@ -9,9 +9,8 @@ import re
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from themeweaver.color_utils.color_names import (
-    generate_random_adjective,
+    compose_palette_name,
     get_color_names_from_api,
-    normalize_color_name_to_safe_ascii,
 )
 from themeweaver.color_utils.color_utils import hex_to_rgb, rgb_to_lch
 from themeweaver.color_utils.mappings_template import (
@@ -68,20 +67,7 @@ def get_palette_names(colors: List[str], color_names: Dict[str, str]) -> Dict[st
 
     def get_creative_name(color: str) -> str:
         """Generate a creative name for a color."""
-        normalized_color = color.upper()
-        color_name = color_names.get(normalized_color)
-
-        if color_name:
-            clean_color_name = normalize_color_name_to_safe_ascii(color_name)
-            if not clean_color_name:
-                clean_color_name = f"Color{color.replace('#', '').upper()}"
-            adjective = generate_random_adjective()
-            return f"{adjective}{clean_color_name}"
-        else:
-            # Fallback to hex color if no name found
-            fallback_name = color.replace("#", "")
-            adjective = generate_random_adjective()
-            return f"{adjective}{fallback_name}"
+        return compose_palette_name(color, color_names.get(color.upper()), quiet=True)
 
     return {
         "primary": get_creative_name(colors[0]),
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any, Dict, List
 
-import yaml
+from themeweaver.core.yaml_loader import safe_load_yaml
 
 
 def _expand_rules(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,7 +56,7 @@ def load_rules(variant: str, rules_dir: Path | None = None) -> Dict[str, Any]:
         raise FileNotFoundError(f"Rules file not found: {filepath}")
 
     with open(filepath, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = safe_load_yaml(f)
 
     if not data:
         return {}
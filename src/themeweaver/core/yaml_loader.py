@@ -10,6 +10,14 @@ from typing import Any, Dict, List, Optional, Union
 
 import yaml
 
+# libyaml's C parser when PyYAML was built with it, the pure-Python one otherwise
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def safe_load_yaml(stream: Any) -> Any:
+    """Same as yaml.safe_load(), but parses with libyaml when available."""
+    return yaml.load(stream, Loader=_SAFE_LOADER)
+
 
 def load_yaml_file(
     file_path: Path, section: Optional[str] = None
@@ -30,7 +38,7 @@ def load_yaml_file(
     """
     try:
         with open(file_path, "r", encoding="utf-8") as file:
-            data = yaml.safe_load(file)
+            data = safe_load_yaml(file)
 
         if section and isinstance(data, dict):
             return data.get(section, {})
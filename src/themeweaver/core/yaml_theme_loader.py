@@ -9,9 +9,8 @@ import re
 from pathlib import Path
 from typing import Any, Dict, Union
 
-import yaml
-
 from themeweaver.core.syntax_schema import syntax_palette_slot_count
+from themeweaver.core.yaml_loader import safe_load_yaml
 
 _logger = logging.getLogger(__name__)
 
@@ -31,7 +30,7 @@ def load_theme_from_yaml(yaml_path: Union[str, Path]) -> Dict[str, Any]:
         raise FileNotFoundError(f"Theme definition file not found: {yaml_path}")
 
     with open(yaml_path, "r") as f:
-        yaml_data = yaml.safe_load(f)
+        yaml_data = safe_load_yaml(f)
 
     if not yaml_data:
         raise ValueError(f"Empty or invalid YAML file: {yaml_path}")
@@ -0,0 +1,14 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from themeweaver.color_utils import color_names
+
+
+@pytest.fixture(autouse=True)
+def isolated_color_name_cache(tmp_path, monkeypatch):
+    """Keep tests off the user's color name cache and out of each other's."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    color_names._color_name_memory_cache.clear()
+    yield
+    color_names._color_name_memory_cache.clear()
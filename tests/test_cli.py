@@ -186,3 +186,18 @@ class TestCLIPackageEntrypoint:
         )
         assert result.returncode == 0
         assert "ThemeWeaver" in result.stdout
+
+    def test_parser_does_not_import_color_stack(self) -> None:
+        """Building the parser (as --help does) leaves numpy unloaded."""
+        code = (
+            "import sys; from themeweaver.cli import create_parser; "
+            "create_parser(); print('numpy' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+        )
+        assert result.returncode == 0
+        assert result.stdout.strip() == "False"
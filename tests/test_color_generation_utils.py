@@ -2,14 +2,32 @@
 
 from unittest.mock import patch
 
+import numpy as np
+import pytest
+
 from themeweaver.color_utils.color_generation import (
+    _generate_optimal_colors_cached,
+    _generate_theme_colors_cached,
+    _golden_ratio_hues,
+    _hue_chroma_factors,
     apply_theme_adjustments,
+    apply_theme_adjustments_batch,
     generate_optimal_colors,
     generate_theme_colors,
     generate_uniform_colors,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_palette_caches():
+    """Keep patched helpers from leaking palettes through the caches."""
+    _generate_theme_colors_cached.cache_clear()
+    _generate_optimal_colors_cached.cache_clear()
+    yield
+    _generate_theme_colors_cached.cache_clear()
+    _generate_optimal_colors_cached.cache_clear()
+
+
 def test_apply_theme_adjustments_dark_and_light_bounds() -> None:
     dark = apply_theme_adjustments([10, 119, 30], "dark")
     light = apply_theme_adjustments([94, 119, 40], "light")
@@ -19,14 +37,26 @@ def test_apply_theme_adjustments_dark_and_light_bounds() -> None:
     assert light[1] <= 120
 
 
-def test_generate_uniform_colors_calls_lch_to_hex_per_color() -> None:
+def test_apply_theme_adjustments_batch_matches_scalar() -> None:
+    lightness = np.array([10.0, 50.0, 94.0])
+    chroma = np.array([20.0, 80.0, 119.0])
+    for theme in ("dark", "light"):
+        batch_l, batch_c = apply_theme_adjustments_batch(lightness, chroma, theme)
+        for i in range(3):
+            scalar = apply_theme_adjustments([lightness[i], chroma[i], 0], theme)
+            assert batch_l[i] == scalar[0]
+            assert batch_c[i] == scalar[1]
+
+
+def test_generate_uniform_colors_converts_palette_in_one_batch() -> None:
     with patch(
-        "themeweaver.color_utils.color_generation.lch_to_hex",
-        side_effect=["#111111", "#222222", "#333333"],
+        "themeweaver.color_utils.color_generation.lch_to_hex_batch",
+        return_value=["#111111", "#222222", "#333333"],
     ) as mock_hex:
         colors = generate_uniform_colors(3, 0, 60, 70, "dark")
     assert colors == ["#111111", "#222222", "#333333"]
-    assert mock_hex.call_count == 3
+    assert mock_hex.call_count == 1
+    assert list(mock_hex.call_args.args[2]) == [0, 120, 240]
 
 
 def test_generate_theme_colors_uniform_and_golden_paths() -> None:
@@ -50,12 +80,13 @@ def test_generate_theme_colors_uniform_and_golden_paths() -> None:
 def test_generate_optimal_colors_start_hue_and_hue_bands() -> None:
     captured_hues = []
 
-    def fake_hex(_l: float, _c: float, h: float) -> str:
-        captured_hues.append(h)
-        return "#123456"
+    def fake_hex_batch(_l, _c, hues) -> list:
+        captured_hues.extend(hues)
+        return ["#123456"] * len(hues)
 
     with patch(
-        "themeweaver.color_utils.color_generation.lch_to_hex", side_effect=fake_hex
+        "themeweaver.color_utils.color_generation.lch_to_hex_batch",
+        side_effect=fake_hex_batch,
     ):
         colors = generate_optimal_colors(num_colors=8, theme="dark", start_hue=70)
     assert len(colors) == 8
@@ -65,8 +96,36 @@ def test_generate_optimal_colors_start_hue_and_hue_bands() -> None:
 
 def test_generate_optimal_colors_without_start_hue_light_theme() -> None:
     with patch(
-        "themeweaver.color_utils.color_generation.lch_to_hex",
-        return_value="#654321",
+        "themeweaver.color_utils.color_generation.lch_to_hex_batch",
+        side_effect=lambda _l, _c, hues: ["#654321"] * len(hues),
     ):
         colors = generate_optimal_colors(num_colors=5, theme="light", start_hue=None)
     assert len(colors) == 5
+
+
+def test_hue_chroma_factors_band_edges() -> None:
+    hues = np.array([0, 60, 180, 180.5, 240, 240.5, 300, 300.5])
+    assert _hue_chroma_factors(hues).tolist() == [
+        1.0,
+        1.3,
+        1.3,
+        1.2,
+        1.2,
+        1.1,
+        1.1,
+        1.0,
+    ]
+
+
+def test_generate_optimal_colors_returns_fresh_copies() -> None:
+    first = generate_optimal_colors(num_colors=4, theme="dark", start_hue=10)
+    first.append("#000000")
+    second = generate_optimal_colors(num_colors=4, theme="dark", start_hue=10)
+    assert len(second) == 4
+    assert _generate_optimal_colors_cached.cache_info().hits == 1
+
+
+def test_golden_ratio_hues_beyond_precomputed_table() -> None:
+    expected = np.mod(37 + np.arange(1500) * 360 * 0.618033988749895, 360)
+    assert np.array_equal(_golden_ratio_hues(1500, 37), expected)
+    assert np.array_equal(_golden_ratio_hues(12, 37), expected[:12])
@@ -1,6 +1,46 @@
 """Tests for color name normalization and API parsing."""
 
-from themeweaver.color_utils.color_names import normalize_color_name_to_safe_ascii
+import gzip
+import json
+import sqlite3
+import urllib.parse
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from themeweaver.color_utils import color_names
+from themeweaver.color_utils.color_names import (
+    clear_color_name_cache,
+    compose_palette_name,
+    delete_cached_color_name,
+    get_color_names_for_palettes,
+    get_color_names_from_api,
+    get_palette_names_from_colors,
+    normalize_color_name_to_safe_ascii,
+)
+
+
+@pytest.fixture
+def isolated_name_cache(tmp_path):
+    """Path of the persistent color name cache (redirected by conftest)."""
+    return tmp_path / "themeweaver" / "color_names.sqlite"
+
+
+def _api_response(names: dict, compress: bool = False) -> MagicMock:
+    """Build a urlopen() context manager returning color.pizza style JSON."""
+    payload = {
+        "colors": [
+            {"requestedHex": hex_value, "name": name}
+            for hex_value, name in names.items()
+        ]
+    }
+    body = json.dumps(payload).encode()
+    response = MagicMock()
+    response.read.return_value = gzip.compress(body) if compress else body
+    response.headers = {"Content-Encoding": "gzip"} if compress else {}
+    response.__enter__.return_value = response
+    return response
 
 
 def test_normalize_apostrophe_and_spaces() -> None:
@@ -28,3 +68,219 @@ def test_normalize_non_latin_only() -> None:
 
 def test_normalize_mixed_and_digits() -> None:
     assert normalize_color_name_to_safe_ascii("Level 42 Gray") == "Level42Gray"
+
+
+def test_api_names_are_cached_in_memory_and_on_disk(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen", return_value=_api_response({"#FF0000": "Red"})
+    ) as mock_urlopen:
+        assert get_color_names_from_api(["#ff0000"], quiet=True) == {"#FF0000": "Red"}
+        assert get_color_names_from_api(["#ff0000"], quiet=True) == {"#FF0000": "Red"}
+    assert mock_urlopen.call_count == 1
+    assert isolated_name_cache.exists()
+
+    # A fresh process (empty memory tier) is served from disk
+    color_names._color_name_memory_cache.clear()
+    with patch("urllib.request.urlopen") as mock_urlopen:
+        assert get_color_names_from_api(["FF0000"], quiet=True) == {"#FF0000": "Red"}
+    mock_urlopen.assert_not_called()
+
+
+def test_cache_lookups_do_not_create_the_cache(isolated_name_cache) -> None:
+    with patch("urllib.request.urlopen", side_effect=OSError("offline")):
+        assert get_color_names_from_api(["#FF0000"], quiet=True) == {}
+    delete_cached_color_name("#FF0000")
+    clear_color_name_cache()
+    assert not isolated_name_cache.parent.exists()
+
+
+def test_cache_schema_is_created_once_per_path(isolated_name_cache) -> None:
+    # Directory and table are only set up on the first write
+    with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as spy:
+        color_names._store_color_names({"#FF0000": "Red"}, "bestOf")
+        color_names._store_color_names({"#0000FF": "Blue"}, "bestOf")
+    assert spy.call_count == 1
+    assert isolated_name_cache in color_names._color_name_cache_schemas
+
+    color_names._color_name_memory_cache.clear()
+    names = color_names._get_cached_color_names(["#FF0000", "#0000FF"], "bestOf")
+    assert names == {"#FF0000": "Red", "#0000FF": "Blue"}
+
+
+def test_cache_lookup_batches_large_palettes(isolated_name_cache) -> None:
+    names = {f"#{i:06X}": f"Name{i}" for i in range(2500)}
+    color_names._store_color_names(names, "bestOf")
+    color_names._color_name_memory_cache.clear()
+
+    # Emulate an SQLite build with the old 999 bound-variable limit
+    open_cache = color_names._open_color_name_cache
+
+    def open_limited_cache(create=False):
+        connection = open_cache(create)
+        connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        return connection
+
+    with patch.object(color_names, "_open_color_name_cache", open_limited_cache):
+        assert color_names._get_cached_color_names(list(names), "bestOf") == names
+
+
+def test_gzipped_api_response_is_decompressed(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen",
+        return_value=_api_response({"#00FF00": "Green"}, compress=True),
+    ) as mock_urlopen:
+        names = get_color_names_from_api(["#00ff00"], quiet=True)
+    assert names == {"#00FF00": "Green"}
+    assert mock_urlopen.call_args.args[0].get_header("Accept-encoding") == "gzip"
+
+
+def test_large_requests_are_split_into_chunks(isolated_name_cache) -> None:
+    def respond(request, timeout):
+        query = urllib.parse.urlparse(request.full_url).query
+        values = urllib.parse.parse_qs(query)["values"][0].split(",")
+        assert len(values) <= color_names._API_MAX_COLORS_PER_REQUEST
+        return _api_response({f"#{v.upper()}": f"Name {v}" for v in values})
+
+    colors = [f"#{i:06x}" for i in range(250)]
+    with patch("urllib.request.urlopen", side_effect=respond) as mock_urlopen:
+        names = get_color_names_from_api(colors, quiet=True)
+    assert mock_urlopen.call_count == 3
+    assert len(names) == 250
+    assert names["#0000F9"] == "Name0000f9"
+
+
+def test_failed_chunk_keeps_the_chunks_that_succeeded(isolated_name_cache) -> None:
+    def respond(request, timeout):
+        query = urllib.parse.urlparse(request.full_url).query
+        values = urllib.parse.parse_qs(query)["values"][0].split(",")
+        if "000064" in values:
+            raise OSError("flaky")
+        return _api_response({f"#{v.upper()}": f"Name {v}" for v in values})
+
+    colors = [f"#{i:06x}" for i in range(250)]
+    with patch("urllib.request.urlopen", side_effect=respond):
+        names = get_color_names_from_api(colors, quiet=True)
+    assert len(names) == 150
+    assert "#000064" not in names
+
+    # Only the failed chunk is requested again
+    with patch("urllib.request.urlopen", side_effect=respond) as mock_urlopen:
+        get_color_names_from_api(colors, quiet=True)
+    url = mock_urlopen.call_args.args[0].full_url
+    assert mock_urlopen.call_count == 1
+    assert "000064" in url and "000000" not in url
+
+
+def test_api_requests_only_uncached_colors(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen", return_value=_api_response({"#FF0000": "Red"})
+    ):
+        get_color_names_from_api(["#FF0000"], quiet=True)
+
+    with patch(
+        "urllib.request.urlopen", return_value=_api_response({"#0000FF": "Blue"})
+    ) as mock_urlopen:
+        names = get_color_names_from_api(["#FF0000", "#0000FF"], quiet=True)
+    assert names == {"#FF0000": "Red", "#0000FF": "Blue"}
+    url = mock_urlopen.call_args.args[0].full_url
+    assert "0000ff" in url and "ff0000" not in url
+
+
+def test_clear_and_delete_cached_color_names(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen",
+        return_value=_api_response({"#FF0000": "Red", "#0000FF": "Blue"}),
+    ):
+        get_color_names_from_api(["#FF0000", "#0000FF"], quiet=True)
+
+    delete_cached_color_name("ff0000")
+    with patch("urllib.request.urlopen", side_effect=OSError("offline")):
+        assert get_color_names_from_api(["#FF0000", "#0000FF"], quiet=True) == {
+            "#0000FF": "Blue"
+        }
+
+    clear_color_name_cache()
+    with patch("urllib.request.urlopen", side_effect=OSError("offline")):
+        assert get_color_names_from_api(["#0000FF"], quiet=True) == {}
+
+
+def test_palette_names_from_colors_uses_one_request(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen", return_value=_api_response({"#FF0000": "Red"})
+    ) as mock_urlopen:
+        names = get_palette_names_from_colors(
+            ["#FF0000", "#ff0000", "#123456"], creative=False, quiet=True
+        )
+    assert names == {"#FF0000": "Red", "#ff0000": "Red", "#123456": "123456"}
+    assert mock_urlopen.call_count == 1
+    # Duplicate colors are only requested once
+    assert mock_urlopen.call_args.args[0].full_url.count("ff0000") == 1
+
+
+def test_color_names_for_palettes_share_one_request(isolated_name_cache) -> None:
+    with patch(
+        "urllib.request.urlopen",
+        return_value=_api_response({"#FF0000": "Red", "#0000FF": "Blue"}),
+    ) as mock_urlopen:
+        names = get_color_names_for_palettes(
+            [["#FF0000", "#0000FF"], ["0000ff"]], quiet=True
+        )
+    assert names == [{"#FF0000": "Red", "#0000FF": "Blue"}, {"#0000FF": "Blue"}]
+    assert mock_urlopen.call_count == 1
+
+
+@pytest.mark.skipif(
+    not color_names.RANDOMNAME_AVAILABLE, reason="randomname not installed"
+)
+def test_random_adjective_comes_from_cached_word_lists() -> None:
+    words = {
+        word.title()
+        for category in color_names._ADJECTIVE_CATEGORIES
+        for word in color_names._adjective_words(category)
+    }
+    for _ in range(20):
+        assert color_names.generate_random_adjective() in words
+    assert "Brute-Force" in words
+
+
+@pytest.mark.skipif(
+    not color_names.RANDOMNAME_AVAILABLE, reason="randomname not installed"
+)
+def test_random_adjective_falls_back_to_public_generate() -> None:
+    color_names._adjective_words.cache_clear()
+    try:
+        with (
+            patch.object(
+                color_names.randomname.util, "load", side_effect=AttributeError
+            ),
+            patch.object(
+                color_names.randomname, "generate", return_value="brute-force"
+            ) as mock_generate,
+        ):
+            assert color_names.generate_random_adjective() == "Brute-Force"
+        assert mock_generate.call_args.args[0].startswith("adj/")
+    finally:
+        color_names._adjective_words.cache_clear()
+
+
+def test_public_surface_is_declared() -> None:
+    for name in color_names.__all__:
+        assert hasattr(color_names, name)
+    assert "_request_color_names" not in color_names.__all__
+
+
+def test_compose_palette_name_fallbacks() -> None:
+    assert compose_palette_name("#ff0000", "Café Noir", creative=False) == "CafeNoir"
+    assert compose_palette_name("#ff0000", "日本", creative=False) == "ColorFF0000"
+    assert compose_palette_name("#ff0000", None, creative=False) == "ff0000"
+    with patch.object(color_names, "generate_random_adjective", return_value="Calm"):
+        assert compose_palette_name("#ff0000", "Red", quiet=True) == "CalmRed"
+
+
+def test_normalize_hex() -> None:
+    normalized = "#A1B2C3"
+    assert color_names._normalize_hex(normalized) is normalized
+    assert color_names._normalize_hex("#123456") == "#123456"
+    assert color_names._normalize_hex("a1b2c3") == "#A1B2C3"
+    assert color_names._normalize_hex("#a1B2c3") == "#A1B2C3"
+    assert color_names._normalize_hex("##a1b2c3") == "#A1B2C3"
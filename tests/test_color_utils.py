@@ -8,6 +8,7 @@ Run with: `python -m pytest tests/test_color_utils.py -v`
 import sys
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 # Add src to path for imports
@@ -33,6 +34,38 @@ class TestColorUtils:
         assert hex_to_rgb("ff0000") == (255, 0, 0)  # Without #
         assert hex_to_rgb("#FF0000") == (255, 0, 0)  # Uppercase
 
+        # Float channels are truncated
+        assert rgb_to_hex((10.9, 0, 255)) == "#0A00FF"
+
+    def test_hex_to_rgb_rejects_invalid_digits(self) -> None:
+        """Test that malformed hex strings raise ValueError."""
+        from themeweaver.color_utils import hex_to_rgb
+
+        for bad in ("#GG0000", "#FF 00 ", "#FFF"):
+            with pytest.raises(ValueError):
+                hex_to_rgb(bad)
+
+    def test_hex_rgb_batch_conversion(self) -> None:
+        """Test vectorized hex <-> RGB conversion against the scalar versions."""
+        from themeweaver.color_utils import (
+            hex_to_rgb,
+            hex_to_rgb_batch,
+            rgb_to_hex,
+            rgb_to_hex_batch,
+        )
+
+        colors = ["#ff0000", "00FF00", "#0a0B0c", "#FFFFFF"]
+        rgb = hex_to_rgb_batch(colors)
+        assert rgb.shape == (4, 3)
+        assert [tuple(row) for row in rgb.tolist()] == [hex_to_rgb(c) for c in colors]
+        assert rgb_to_hex_batch(rgb) == [rgb_to_hex(hex_to_rgb(c)) for c in colors]
+
+        for bad in (["#GG0000"], ["#FFF"], ["#FF 00 "]):
+            with pytest.raises(ValueError):
+                hex_to_rgb_batch(bad)
+        with pytest.raises(ValueError):
+            rgb_to_hex_batch([[256, 0, 0]])
+
     def test_hsv_conversion(self) -> None:
         """Test HSV color space conversion."""
         from themeweaver.color_utils import hsv_to_rgb, rgb_to_hsv
@@ -49,6 +82,43 @@ class TestColorUtils:
             abs(a - b) < 2 for a, b in zip(rgb_back, (255, 0, 0))
         )  # Allow small rounding errors
 
+    def test_rgb_to_hsv_matches_colorsys(self) -> None:
+        """Test that the inlined HSV conversion reproduces colorsys exactly."""
+        import colorsys
+
+        from themeweaver.color_utils import rgb_to_hsv
+
+        for rgb in [
+            (0, 0, 0),
+            (255, 255, 255),
+            (255, 0, 0),
+            (12, 200, 99),
+            (18, 52, 86),
+            (200, 10, 200),
+            (128, 128, 0),
+        ]:
+            expected = colorsys.rgb_to_hsv(*(c / 255.0 for c in rgb))
+            assert rgb_to_hsv(rgb) == expected
+
+    def test_hsv_batch_conversion_matches_scalar(self) -> None:
+        """Test vectorized RGB <-> HSV against the scalar versions."""
+        from themeweaver.color_utils import (
+            hsv_to_rgb,
+            hsv_to_rgb_batch,
+            rgb_to_hsv,
+            rgb_to_hsv_batch,
+        )
+
+        rgb = [(0, 0, 0), (255, 255, 255), (255, 0, 0), (12, 200, 99), (200, 10, 200)]
+        hsv = rgb_to_hsv_batch(rgb)
+        assert [tuple(row) for row in hsv.tolist()] == [rgb_to_hsv(c) for c in rgb]
+
+        hsv_values = [(0.0, 0.0, 0.5), (0.1, 0.8, 0.9), (0.55, 0.3, 0.4), (1.0, 1, 1)]
+        back = hsv_to_rgb_batch(hsv_values)
+        assert [tuple(row) for row in back.tolist()] == [
+            hsv_to_rgb(v) for v in hsv_values
+        ]
+
     def test_lch_conversion(self) -> None:
         """Test LCH color space conversion."""
         from themeweaver.color_utils import calculate_delta_e, lch_to_hex, rgb_to_lch
@@ -67,16 +137,192 @@ class TestColorUtils:
         assert isinstance(delta_e, (int, float))
         assert delta_e > 0
 
+    def test_rgb_to_lch_batch_matches_scalar(self) -> None:
+        """Test that batch RGB -> LCH conversion agrees with rgb_to_lch."""
+        from themeweaver.color_utils import rgb_to_lch, rgb_to_lch_batch
+
+        rgb = [(255, 0, 0), (0, 0, 0), (18, 52, 86), (255, 255, 255)]
+        batch = rgb_to_lch_batch(np.array(rgb))
+        assert batch.shape == (4, 3)
+        for row, color in zip(batch, rgb):
+            assert np.array_equal(row, rgb_to_lch(color))
+
+        # Float and non-finite input follow the scalar path too
+        odd = [(12.5, 300.0, -4.0), (float("nan"), 0.0, 0.0)]
+        with np.errstate(invalid="ignore"):
+            odd_batch = rgb_to_lch_batch(np.array(odd))
+            for row, color in zip(odd_batch, odd):
+                assert np.array_equal(row, rgb_to_lch(color), equal_nan=True)
+
+    def test_srgb1_to_lch_matches_colorspacious(self) -> None:
+        """Test that the inlined sRGB -> LCH kernel reproduces colorspacious."""
+        import colorspacious
+
+        from themeweaver.color_utils.color_utils import _srgb1_to_lch
+
+        levels = np.arange(0, 256, 15) / 255.0
+        rgb = np.stack(np.meshgrid(levels, levels, levels), axis=-1).reshape(-1, 3)
+        expected = colorspacious.cspace_convert(rgb, "sRGB1", "CIELCh")
+        assert np.array_equal(_srgb1_to_lch(rgb), expected)
+
+    def test_srgb255_lookup_table_matches_gamma_formula(self) -> None:
+        """Test that the 8-bit linearization table gives identical LCH values."""
+        from themeweaver.color_utils.color_utils import _srgb1_to_lch, _srgb255_to_lch
+
+        levels = np.arange(0, 256, 5)
+        rgb = np.stack(np.meshgrid(levels, levels, levels), axis=-1).reshape(-1, 3)
+        assert np.array_equal(_srgb255_to_lch(rgb), _srgb1_to_lch(rgb / 255.0))
+
+    def test_hex_to_lch_batch_matches_scalar(self) -> None:
+        """Test that batch hex -> LCH conversion agrees with the scalar chain."""
+        from themeweaver.color_utils import hex_to_lch_batch, hex_to_rgb, rgb_to_lch
+
+        colors = ["#FF0000", "000000", "#123456", "#abcdef"]
+        batch = hex_to_lch_batch(colors)
+        for row, color in zip(batch, colors):
+            assert np.array_equal(row, rgb_to_lch(hex_to_rgb(color)))
+
+        with pytest.raises(ValueError):
+            hex_to_lch_batch(["#12345"])
+
+    def test_is_color_dark_batch_matches_scalar(self) -> None:
+        """Test that batch dark/light classification agrees with is_color_dark."""
+        from themeweaver.color_utils import is_color_dark, is_color_dark_batch
+
+        colors = ["#000000", "#FFFFFF", "#808080", "#404040", "#FF0000"]
+        for threshold in (35.0, 50.0):
+            dark = is_color_dark_batch(colors, threshold=threshold)
+            assert dark.tolist() == [is_color_dark(c, threshold) for c in colors]
+
+        with pytest.raises(ValueError):
+            is_color_dark_batch(["#000000", "#GGGGGG"])
+
+    def test_rgb_to_lch_cache_returns_independent_arrays(self) -> None:
+        """Test that cached LCH results can't be corrupted by callers."""
+        from themeweaver.color_utils import rgb_to_lch
+
+        first = rgb_to_lch((12, 34, 56))
+        first[0] = -1
+        assert rgb_to_lch((12, 34, 56))[0] > 0
+
+    def test_calculate_delta_e_batch(self) -> None:
+        """Test pairwise and one-vs-many batch Delta E."""
+        from themeweaver.color_utils import calculate_delta_e, calculate_delta_e_batch
+
+        colors = ["#ff0000", "#00ff00", "#0000ff"]
+        pairwise = calculate_delta_e_batch(colors[:-1], colors[1:])
+        for value, (c1, c2) in zip(pairwise, zip(colors[:-1], colors[1:])):
+            assert value == pytest.approx(calculate_delta_e(c1, c2))
+
+        one_vs_many = calculate_delta_e_batch("#ff0000", colors)
+        assert one_vs_many.shape == (3,)
+        assert one_vs_many[0] == pytest.approx(0.0)
+
+        # Invalid colors give NaN instead of None
+        assert np.isnan(calculate_delta_e_batch("#ff0000", ["#zzzzzz"])[0])
+
+    def test_calculate_delta_e_matrix(self) -> None:
+        """Test the pairwise Delta E matrix against calculate_delta_e."""
+        from themeweaver.color_utils import calculate_delta_e, calculate_delta_e_matrix
+
+        colors = ["#ff0000", "#00ff00", "#0000ff", "#zzzzzz"]
+        matrix = calculate_delta_e_matrix(colors)
+        assert matrix.shape == (4, 4)
+        for i, c1 in enumerate(colors[:3]):
+            assert matrix[i, i] == 0
+            for j, c2 in enumerate(colors[:3]):
+                assert matrix[i, j] == pytest.approx(calculate_delta_e(c1, c2))
+        assert np.isnan(matrix[3]).all() and np.isnan(matrix[:, 3]).all()
+
+    def test_calculate_delta_e_matches_colorspacious(self) -> None:
+        """Test that cached CAM02-UCS coordinates give the deltaE() result."""
+        import colorspacious
+
+        from themeweaver.color_utils import calculate_delta_e
+        from themeweaver.color_utils.color_utils import _hex_to_cam02ucs_cached
+
+        _hex_to_cam02ucs_cached.cache_clear()
+        for other in ("#00FF00", "#123456", "#FF0000"):
+            expected = colorspacious.deltaE(
+                colorspacious.cspace_convert([1.0, 0.0, 0.0], "sRGB1", "CIELab"),
+                colorspacious.cspace_convert(
+                    [c / 255.0 for c in bytes.fromhex(other[1:])], "sRGB1", "CIELab"
+                ),
+                input_space="CIELab",
+            )
+            assert calculate_delta_e("#FF0000", other) == expected
+        # The reference color is converted only once
+        assert _hex_to_cam02ucs_cached.cache_info().misses == 3
+
+    def test_lch_to_hex_is_cached(self) -> None:
+        """Test that repeated scalar LCH conversions hit the cache."""
+        from themeweaver.color_utils import lch_to_hex
+
+        lch_to_hex.cache_clear()
+        assert lch_to_hex(60, 40, 200) == lch_to_hex(60, 40, 200)
+        assert lch_to_hex.cache_info().hits == 1
+
+    def test_hex_conversions_are_cached(self) -> None:
+        """Test that a hex color is converted to LCH only once."""
+        from themeweaver.color_utils import get_color_info, is_color_dark
+        from themeweaver.color_utils.color_utils import _hex_to_lch_cached
+
+        get_color_info.cache_clear()
+        _hex_to_lch_cached.cache_clear()
+        assert is_color_dark("#1A2B3C")
+        assert get_color_info("#1A2B3C").lch_lightness < 35
+        info = _hex_to_lch_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_lch_to_hex_batch_matches_scalar(self) -> None:
+        """Test that batch LCH conversion agrees with lch_to_hex."""
+        from themeweaver.color_utils import lch_to_hex, lch_to_hex_batch
+
+        lch_values = [(0, 0, 0), (100, 0, 0), (53.2, 104.6, 40), (90, 130, 250)]
+        expected = [lch_to_hex(*lch) for lch in lch_values]
+        assert lch_to_hex_batch(*zip(*lch_values)) == expected
+
+        # Scalars broadcast against arrays; non-finite rows use the gray fallback
+        assert lch_to_hex_batch(50, 0, [0, 180]) == [lch_to_hex(50, 0, 0)] * 2
+        assert lch_to_hex_batch([float("nan")], [0], [0]) == ["#808080"]
+        assert lch_to_hex(float("nan"), 0, 0) == "#808080"
+
+    def test_lch_to_hex_round_trip(self) -> None:
+        """Test that hex -> LCH -> hex gives back the original color."""
+        from themeweaver.color_utils import hex_to_rgb, lch_to_hex, rgb_to_lch
+
+        # Channels are rounded, not truncated, so values that come back a few
+        # ulps below an integer level don't drop to the next color down
+        for color in ("#300E5D", "#01140B", "#C79505", "#000000", "#FFFFFF"):
+            assert lch_to_hex(*rgb_to_lch(hex_to_rgb(color))) == color
+
     def test_color_info(self) -> None:
         """Test color information retrieval."""
         from themeweaver.color_utils import get_color_info
 
         info = get_color_info("#ff0000")
-        assert isinstance(info, dict)
-        assert "hex" in info
-        assert "rgb" in info
-        assert info["hex"] == "#ff0000"
-        assert info["rgb"] == (255, 0, 0)
+        assert info.hex == "#ff0000"
+        assert info.rgb == (255, 0, 0)
+        assert info.hsv_degrees == (0.0, 1.0, 1.0)
+        assert info.lch_lightness == info.lch[0]
+        # Results are immutable, so repeated lookups share one cached instance
+        assert get_color_info("#ff0000") is info
+
+        as_dict = info.as_dict()
+        assert isinstance(as_dict, dict)
+        assert as_dict["hex"] == "#ff0000"
+        assert as_dict["rgb"] == (255, 0, 0)
+        assert as_dict["lch_hue"] == info.lch[2]
+
+    def test_calculate_std_dev(self) -> None:
+        """Test population standard deviation for short and long lists."""
+        import statistics
+
+        from themeweaver.color_utils import calculate_std_dev
+
+        assert calculate_std_dev([]) == 0
+        for values in ([2.0, 4.0, 4.0, 5.0], [float(i % 7) for i in range(300)]):
+            assert calculate_std_dev(values) == pytest.approx(statistics.pstdev(values))
 
     def test_relative_luminance(self) -> None:
         """Test WCAG relative luminance."""
@@ -226,6 +472,17 @@ class TestColorAnalysis:
         assert len(distances) == 2  # 3 colors -> 2 distance measurements
         assert all("delta_e" in d for d in distances)
 
+    def test_chromatic_distances_quiet(self, capsys) -> None:
+        """Test that verbose=False returns distances without printing."""
+        from themeweaver.color_utils import analyze_chromatic_distances
+
+        test_colors = ["#ff0000", "#00ff00", "#0000ff"]
+        distances = analyze_chromatic_distances(
+            test_colors, "Test Group", verbose=False
+        )
+        assert len(distances) == 2
+        assert capsys.readouterr().out == ""
+
 
 if __name__ == "__main__":
     # Run tests with pytest
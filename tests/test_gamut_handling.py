@@ -65,6 +65,33 @@ class TestGamutHandling:
             # A slightly higher chroma should be out of gamut
             assert not is_lch_in_gamut(lightness, max_chroma + 1.0, hue)
 
+    def test_find_max_in_gamut_chroma_is_cached(self) -> None:
+        """Test that repeated chroma searches are served from the cache."""
+        from themeweaver.color_utils import find_max_in_gamut_chroma
+
+        find_max_in_gamut_chroma.cache_clear()
+        first = find_max_in_gamut_chroma(60, 120)
+        assert find_max_in_gamut_chroma(60, 120) == first
+        assert find_max_in_gamut_chroma.cache_info().hits == 1
+
+    def test_closed_form_gamut_boundary(self) -> None:
+        """Test the solved chroma boundary against direct gamut checks."""
+        from themeweaver.color_utils import is_lch_in_gamut
+        from themeweaver.color_utils.color_utils import (
+            _max_in_gamut_chroma_closed_form,
+        )
+
+        for lightness in (5, 20, 50, 80, 95):
+            for hue in range(0, 360, 30):
+                boundary = _max_in_gamut_chroma_closed_form(lightness, hue)
+                assert boundary is not None and boundary > 0
+                assert is_lch_in_gamut(lightness, boundary - 1e-3, hue)
+                assert not is_lch_in_gamut(lightness, boundary + 1e-3, hue)
+
+        # Grays outside the gamut leave the search to the fallback
+        assert _max_in_gamut_chroma_closed_form(101, 0) is None
+        assert _max_in_gamut_chroma_closed_form(float("nan"), 0) is None
+
     def test_adjust_lch_to_gamut(self) -> None:
         """Test adjusting out-of-gamut colors."""
         from themeweaver.color_utils import adjust_lch_to_gamut, is_lch_in_gamut
@@ -24,6 +24,8 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from themeweaver.color_utils.interpolation_methods import (
+    _eased_factors,
+    _interpolate_colors_cached,
     circular_interpolate,
     cosine_interpolate,
     cubic_interpolate,
@@ -187,6 +189,19 @@ class TestColorInterpolation:
         assert colors[2] == "#0000FF"  # End color
         assert all(color.startswith("#") for color in colors)
 
+    def test_interpolate_colors_linear_matches_scalar(self) -> None:
+        """Test the vectorized linear ramp against per-channel interpolation."""
+        colors = interpolate_colors("#1A2B3C", "#F0E0D0", 9, method="linear")
+
+        expected = []
+        for i in range(9):
+            rgb = [
+                int(linear_interpolate(a, b, i / 8))
+                for a, b in zip((0x1A, 0x2B, 0x3C), (0xF0, 0xE0, 0xD0))
+            ]
+            expected.append("#{:02X}{:02X}{:02X}".format(*rgb))
+        assert colors == expected
+
     def test_interpolate_colors_cubic(self) -> None:
         """Test color interpolation with cubic method."""
         colors = interpolate_colors("#FF0000", "#0000FF", 5, method="cubic")
@@ -293,6 +308,27 @@ class TestColorInterpolation:
         with pytest.raises(ValueError):
             interpolate_colors("#FF0000", "#0000FF", 3, method="invalid_method")
 
+    def test_interpolate_colors_returns_fresh_copies(self) -> None:
+        """Test cached ramps are shared across hex spellings but not mutable."""
+        _interpolate_colors_cached.cache_clear()
+        first = interpolate_colors("#ff0000", "#0000ff", 5, method="cubic")
+        first.append("#000000")
+        second = interpolate_colors("FF0000", "0000FF", 5, method="cubic")
+
+        assert len(second) == 5
+        assert _interpolate_colors_cached.cache_info().hits == 1
+
+    def test_eased_factors_shared_across_endpoints(self) -> None:
+        """Test ramps with different endpoints reuse one easing curve."""
+        _eased_factors.cache_clear()
+        interpolate_colors("#102030", "#F0E0D0", 7, method="sine")
+        interpolate_colors("#000000", "#FFFFFF", 7, method="sine")
+
+        assert _eased_factors.cache_info().hits == 1
+        eased = _eased_factors("sine", 7, None, 0.0, 1.0)
+        assert eased.tolist() == [sine_interpolate(0.0, 1.0, i / 6) for i in range(7)]
+        assert not eased.flags.writeable
+
 
 if __name__ == "__main__":
     # Run tests with pytest
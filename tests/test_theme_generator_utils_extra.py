@@ -19,11 +19,11 @@ def test_get_palette_names_fallback_for_empty_normalized_name() -> None:
 
     with (
         patch(
-            "themeweaver.color_utils.theme_generator_utils.normalize_color_name_to_safe_ascii",
+            "themeweaver.color_utils.color_names.normalize_color_name_to_safe_ascii",
             return_value="",
         ),
         patch(
-            "themeweaver.color_utils.theme_generator_utils.generate_random_adjective",
+            "themeweaver.color_utils.color_names.generate_random_adjective",
             return_value="Calm",
         ),
     ):
@@ -134,6 +134,19 @@ class TestYAMLLoading:
         assert "YAML file not found" in str(exc_info.value)
         assert "nonexistent_theme" in str(exc_info.value)
 
+    def test_safe_load_yaml_matches_safe_load(self) -> None:
+        """Test that the libyaml-backed loader parses like yaml.safe_load."""
+        import yaml
+
+        from themeweaver.core.yaml_loader import safe_load_yaml
+
+        text = 'theme:\n  name: Demo\n  colors: ["#FF0000", 12, true]\n'
+        assert safe_load_yaml(text) == yaml.safe_load(text)
+
+        # Arbitrary Python objects are still refused
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.getcwd []")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])